@@ -0,0 +1,110 @@
+"""
+Balance analytics for holder snapshots.
+
+Vectorized helpers built on NumPy, which is an optional dependency
+(install with the "analytics" extra). Snapshots written while NumPy is
+available get a .balances.npy sidecar so analysis can skip parsing the
+full holders JSON.
+"""
+
+import os
+import shutil
+from pathlib import Path
+from typing import Iterable
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+
+def _require_numpy():
+    """Raise a helpful error when NumPy is not installed."""
+    if np is None:
+        raise ImportError("NumPy is required for analytics: pip install 'ratu-onchain-monitor[analytics]'")
+
+
+def sidecar_path(snapshot_path: Path) -> Path:
+    """Path of the balances sidecar for a snapshot file."""
+    return snapshot_path.with_name(snapshot_path.name.split(".", 1)[0] + ".balances.npy")
+
+
+def balances_array(holders: Iterable[dict], count: int = -1) -> "np.ndarray":
+    """Build a float64 array of display balances from holder dicts."""
+    _require_numpy()
+    return np.fromiter((float(h.get("balance") or 0) for h in holders), dtype=np.float64, count=count)
+
+
+class BalancesWriter:
+    """
+    Stream display balances into a snapshot's .balances.npy sidecar.
+
+    Each page is appended to a .part file as raw little-endian float64,
+    so memory use is bounded by the page size. The .npy header needs
+    the final length, so close() writes it and copies the raw data in
+    behind it before renaming the sidecar into place.
+    """
+
+    def __init__(self, snapshot_path: Path):
+        _require_numpy()
+        self.path = sidecar_path(snapshot_path)
+        self.count = 0
+        self._raw_path = self.path.with_name(self.path.name + ".raw.part")
+        self._part_path = self.path.with_name(self.path.name + ".part")
+        self._file = open(self._raw_path, "wb")
+
+    def write(self, holders: list[dict]):
+        """Append the balances of one page of holder dicts."""
+        balances = balances_array(holders, count=len(holders))
+        self._file.write(balances.astype("<f8", copy=False).tobytes())
+        self.count += len(balances)
+
+    def close(self) -> Path:
+        """Write the finished sidecar and remove the raw part file."""
+        self._file.close()
+        try:
+            with open(self._part_path, "wb") as out, open(self._raw_path, "rb") as raw:
+                header = {"descr": "<f8", "fortran_order": False, "shape": (self.count,)}
+                np.lib.format.write_array_header_1_0(out, header)
+                shutil.copyfileobj(raw, out)
+            os.replace(self._part_path, self.path)
+        finally:
+            # Drop the raw data, and the sidecar part file if the rename never happened
+            self.abort()
+        return self.path
+
+    def abort(self):
+        """Discard a partially written sidecar."""
+        self._file.close()
+        self._raw_path.unlink(missing_ok=True)
+        self._part_path.unlink(missing_ok=True)
+
+
+def load_balances(snapshot_path: Path) -> "np.ndarray":
+    """Load snapshot balances, from the sidecar if present or else from the snapshot JSON."""
+    from onchain_monitor.snapshot import load_snapshot  # snapshot imports this module
+
+    _require_numpy()
+    path = sidecar_path(snapshot_path)
+    if path.exists():
+        return np.load(path)
+
+    holders = load_snapshot(snapshot_path).get("holders", [])
+    return balances_array(holders, count=len(holders))
+
+
+def top_holder_indices(balances: "np.ndarray", k: int) -> "np.ndarray":
+    """Indices of the k largest balances, largest first, in O(N + k log k)."""
+    _require_numpy()
+    k = min(k, len(balances))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    top = np.argpartition(balances, -k)[-k:]
+    return top[np.argsort(balances[top])[::-1]]
+
+
+def holders_above(balances: "np.ndarray", thresholds: Iterable[float]) -> "np.ndarray":
+    """Count holders with balance >= each threshold (e.g. whale tiers)."""
+    _require_numpy()
+    ordered = np.sort(balances)
+    return len(ordered) - np.searchsorted(ordered, np.asarray(list(thresholds), dtype=np.float64), side="left")
@@ -8,18 +8,44 @@ Provides methods for:
 - Transfer history
 """
 
+import asyncio
+import hashlib
+import itertools
 import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Optional
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterable, Iterator, Optional
 
 import httpx
 
-from onchain_monitor.config import ANKR_RPC_URL, PAGE_SIZE, REQUEST_TIMEOUT
+from onchain_monitor import jsonio
+from onchain_monitor.config import (
+    ANKR_RPC_URL,
+    CACHE_DIR,
+    CURRENCIES_CACHE_TTL,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP_MAX_CONNECTIONS,
+    PAGE_SIZE,
+    PRICE_CACHE_TTL,
+    REQUEST_TIMEOUT,
+)
 
 logger = logging.getLogger(__name__)
 
+# Shared pool settings: keep connections alive between paginated calls
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=HTTP_MAX_CONNECTIONS,
+    max_keepalive_connections=HTTP_MAX_CONNECTIONS,
+    keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class TokenHolder:
     """Represents a token holder."""
 
@@ -28,8 +54,13 @@ class TokenHolder:
     balance_raw: str
     label: str = ""  # Known label (exchange, burn, etc.)
 
+    @property
+    def balance_int(self) -> int:
+        """Raw balance as an exact integer (float loses precision above 2**53)."""
+        return int(self.balance_raw or 0)
+
 
-@dataclass
+@dataclass(slots=True)
 class TokenMetadata:
     """Represents token metadata."""
 
@@ -40,7 +71,7 @@ class TokenMetadata:
     decimals: int
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenInfo:
     """Represents token information."""
 
@@ -70,9 +101,191 @@ KNOWN_LABELS = {
 }
 
 
+# Lowercase-keyed copy so lookups are a single case-insensitive probe
+_LABELS_LOWER = {address.lower(): label for address, label in KNOWN_LABELS.items()}
+
+
 def get_holder_label(address: str) -> str:
-    """Get label for a known address."""
-    return KNOWN_LABELS.get(address, KNOWN_LABELS.get(address.lower(), ""))
+    """
+    Get label for a known address (case-insensitive).
+
+    The address is not validated; anything that is not a known address,
+    malformed input included, simply gets "". The .lower() stays because
+    holder addresses may arrive checksum-cased or lowercase.
+    """
+    return _LABELS_LOWER.get(address.lower(), "")
+
+
+def _holders_params(
+    contract: str, blockchain: str, page_size: int, page_token: Optional[str]
+) -> dict[str, Any]:
+    """Build params for an ankr_getTokenHolders call."""
+    params = {
+        "blockchain": blockchain,
+        "contractAddress": contract,
+        "pageSize": page_size,
+    }
+    if page_token:
+        params["pageToken"] = page_token
+    return params
+
+
+_HOLDER_FIELDS = itemgetter("holderAddress", "balance", "balanceRawInteger")
+
+
+def annotate_labels(holders: list[TokenHolder]) -> list[TokenHolder]:
+    """Fill in known labels on holders in place (meant for small display slices)."""
+    label = _LABELS_LOWER.get
+    for h in holders:
+        h.label = label(h.address.lower(), "")
+    return holders
+
+
+def annotate_label_dicts(holders: list[dict[str, str]]) -> list[dict[str, str]]:
+    """Fill in known labels on snapshot holder dicts in place, one bound lookup per row."""
+    label = _LABELS_LOWER.get
+    for h in holders:
+        h["label"] = label(h["address"].lower(), "")
+    return holders
+
+
+def _parse_holders(
+    result: dict[str, Any], resolve_labels: bool = True
+) -> tuple[list[TokenHolder], Optional[str]]:
+    """Convert an ankr_getTokenHolders result into (holders, next page token)."""
+    rows = result.get("holders", [])
+    try:
+        # itemgetter fetches the three fields in C, in TokenHolder field order
+        holders = [TokenHolder(*fields) for fields in map(_HOLDER_FIELDS, rows)]
+    except KeyError:
+        # Some row is missing a field; fall back to per-field defaults
+        holders = [
+            TokenHolder(
+                address=h.get("holderAddress", ""),
+                balance=h.get("balance", "0"),
+                balance_raw=h.get("balanceRawInteger", "0"),
+            )
+            for h in rows
+        ]
+    if resolve_labels:
+        annotate_labels(holders)
+
+    next_token = result.get("nextPageToken")
+    return holders, next_token
+
+
+def _parse_holders_raw(
+    result: dict[str, Any], resolve_labels: bool = True
+) -> tuple[list[dict[str, str]], Optional[str]]:
+    """Convert an ankr_getTokenHolders result into snapshot-ready dicts and next page token."""
+    holders = [
+        {
+            "address": h.get("holderAddress", ""),
+            "balance": h.get("balance", "0"),
+            "balance_raw": h.get("balanceRawInteger", "0"),
+            "label": "",
+        }
+        for h in result.get("holders", [])
+    ]
+    if resolve_labels:
+        annotate_label_dicts(holders)
+
+    next_token = result.get("nextPageToken")
+    return holders, next_token
+
+
+def _collect_pages(pages: Iterable[list], progress_callback=None) -> list:
+    """Concatenate holder pages, reporting the running count after each page."""
+    all_holders = []
+    for holders in pages:
+        all_holders.extend(holders)
+
+        if progress_callback:
+            progress_callback(len(all_holders))
+
+    return all_holders
+
+
+async def _acollect_pages(pages: AsyncIterator[list], progress_callback=None) -> list:
+    """Async counterpart of _collect_pages."""
+    all_holders = []
+    async for holders in pages:
+        all_holders.extend(holders)
+
+        if progress_callback:
+            progress_callback(len(all_holders))
+
+    return all_holders
+
+
+def _index_currencies(result: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """Index an ankr_getCurrencies result by lowercase token address."""
+    return {c.get("address", "").lower(): c for c in result.get("currencies", [])}
+
+
+def _metadata_from_currency(
+    currency: dict[str, Any], contract: str, blockchain: str
+) -> TokenMetadata:
+    """Build TokenMetadata from one ankr_getCurrencies entry."""
+    return TokenMetadata(
+        contract=contract,
+        blockchain=blockchain,
+        name=currency.get("name", "Unknown"),
+        symbol=currency.get("symbol", "???"),
+        decimals=int(currency.get("decimals", 18)),
+    )
+
+
+# JSON-RPC request framing; only id, method and params vary between calls
+_RPC_TEMPLATE = b'{"id":%d,"jsonrpc":"2.0","method":"%b","params":%b}'
+
+
+def _rpc_payload(request_id: int, method: str, params: dict[str, Any]) -> bytes:
+    """Encode a JSON-RPC request body (method names are plain ASCII identifiers)."""
+    return _RPC_TEMPLATE % (request_id, method.encode(), jsonio.dumps(params))
+
+
+def _cache_path(method: str, params: dict[str, Any]) -> Path:
+    """Cache file for a JSON-RPC call, keyed by method and canonical params."""
+    digest = hashlib.sha256(method.encode() + jsonio.dumps(params, sort_keys=True)).hexdigest()
+    return CACHE_DIR / f"{method}_{digest[:32]}.json"
+
+
+def _read_cache(path: Path, ttl: float) -> Optional[Any]:
+    """
+    Return data cached at path, or None if missing, unreadable, malformed or older than ttl seconds.
+
+    Stale and malformed entries are deleted on the miss. Entries that are
+    never read again (pages of a snapshot that completed) stay until
+    CACHE_DIR is cleared.
+    """
+    if ttl <= 0:
+        return None
+    try:
+        with open(path, "rb") as f:
+            entry = jsonio.loads(f.read())
+    except OSError:
+        return None
+    except ValueError:
+        entry = None
+
+    cached_at = entry.get("cached_at") if isinstance(entry, dict) and "data" in entry else None
+    if not isinstance(cached_at, (int, float)) or time.time() - cached_at > ttl:
+        path.unlink(missing_ok=True)
+        return None
+    return entry["data"]
+
+
+def _write_cache(path: Path, data: Any):
+    """Atomically write data to a cache file."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(jsonio.dumps({"cached_at": time.time(), "data": data}))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not write cache {path}: {e}")
 
 
 class AnkrClient:
@@ -82,23 +295,50 @@ class AnkrClient:
     Provides methods for querying token data via JSON-RPC.
     """
 
-    def __init__(self, rpc_url: Optional[str] = None):
-        """Initialize the Ankr client."""
+    def __init__(self, rpc_url: Optional[str] = None, transport: Optional[httpx.BaseTransport] = None):
+        """
+        Initialize the Ankr client.
+
+        Args:
+            rpc_url: JSON-RPC endpoint (defaults to ANKR_RPC_URL)
+            transport: Optional httpx transport, e.g. httpx.MockTransport in tests
+        """
         self.rpc_url = rpc_url or ANKR_RPC_URL
+        self._transport = transport
         self._client: Optional[httpx.Client] = None
-        self._request_id = 0
+        # The prefetch thread shares this client, so ids and lazy setup must be thread-safe
+        self._request_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._currencies: dict[str, dict[str, dict[str, Any]]] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
 
     def _get_client(self) -> httpx.Client:
-        """Get or create HTTP client."""
-        if self._client is None:
-            self._client = httpx.Client(
-                headers={"Content-Type": "application/json"},
-                timeout=REQUEST_TIMEOUT,
-            )
-        return self._client
+        """Get or create HTTP client (safe to call from the prefetch thread)."""
+        if self._client is not None:
+            return self._client
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(
+                    http2=True,
+                    limits=_HTTP_LIMITS,
+                    headers={"Content-Type": "application/json"},
+                    timeout=REQUEST_TIMEOUT,
+                    transport=self._transport,
+                )
+            return self._client
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get or create the single worker thread used to prefetch pages."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ankr-prefetch")
+            return self._executor
 
     def close(self):
-        """Close the HTTP client."""
+        """Close the HTTP client and stop the prefetch thread."""
+        if self._executor:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
         if self._client:
             self._client.close()
             self._client = None
@@ -109,41 +349,151 @@ class AnkrClient:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
 
-    def _call(self, method: str, params: dict[str, Any]) -> dict[str, Any]:
-        """Make a JSON-RPC call to Ankr API."""
-        self._request_id += 1
-        payload = {
-            "id": self._request_id,
-            "jsonrpc": "2.0",
-            "method": method,
-            "params": params,
-        }
+    def _call(self, method: str, params: dict[str, Any], cache_ttl: float = 0) -> dict[str, Any]:
+        """
+        Make a JSON-RPC call to Ankr API.
+
+        With cache_ttl > 0 a result cached on disk within that many seconds
+        is returned instead, and fresh results are written to the cache.
+        """
+        if cache_ttl > 0:
+            cached = _read_cache(_cache_path(method, params), cache_ttl)
+            if cached is not None:
+                return cached
+
+        payload = _rpc_payload(next(self._request_ids), method, params)
 
         client = self._get_client()
-        response = client.post(self.rpc_url, json=payload)
+        response = client.post(self.rpc_url, content=payload)
         response.raise_for_status()
 
-        data = response.json()
+        data = jsonio.loads(response.content)
         if "error" in data:
             logger.error(f"Ankr API error: {data['error']}")
             raise ValueError(f"Ankr API error: {data['error']}")
 
-        return data.get("result", {})
+        result = data.get("result", {})
+        if cache_ttl > 0:
+            _write_cache(_cache_path(method, params), result)
+        return result
 
-    def get_token_holders_count(self, contract: str, blockchain: str = "bsc") -> int:
+    def batch_call(self, calls: list[tuple[str, dict[str, Any]]]) -> list[Any]:
+        """
+        Make several JSON-RPC calls in a single HTTP request.
+
+        Args:
+            calls: List of (method, params) tuples
+
+        Returns:
+            Results in the same order as calls. A call that returned an
+            error yields a ValueError instance instead of its result, so one
+            failing request does not break the rest of the batch.
+        """
+        requests = []
+        for method, params in calls:
+            request_id = next(self._request_ids)
+            requests.append((request_id, method, _rpc_payload(request_id, method, params)))
+        payload = b"[" + b",".join(body for _, _, body in requests) + b"]"
+
+        client = self._get_client()
+        response = client.post(self.rpc_url, content=payload)
+        response.raise_for_status()
+
+        data = jsonio.loads(response.content)
+        if isinstance(data, dict):
+            # Server rejected the batch as a whole
+            logger.error(f"Ankr API error: {data.get('error')}")
+            raise ValueError(f"Ankr API error: {data.get('error')}")
+
+        by_id = {item.get("id"): item for item in data}
+        results: list[Any] = []
+        for request_id, method, _ in requests:
+            item = by_id.get(request_id)
+            if item is None:
+                results.append(ValueError(f"Ankr API error: no response for {method}"))
+            elif "error" in item:
+                logger.error(f"Ankr API error: {item['error']}")
+                results.append(ValueError(f"Ankr API error: {item['error']}"))
+            else:
+                results.append(item.get("result", {}))
+
+        return results
+
+    def prefetch_token_info(
+        self,
+        contract: str,
+        blockchain: str = "bsc",
+        holder_count: bool = False,
+        holders_page_size: int = 0,
+    ) -> dict[str, Any]:
+        """
+        Fetch a token's price, currencies and optional holder data in one round trip.
+
+        The currency list is left out of the batch when it is already cached.
+
+        Args:
+            contract: Token contract address
+            blockchain: Blockchain name
+            holder_count: Also fetch the holder count
+            holders_page_size: Also fetch the first holders page of this size (0 skips it)
+
+        Returns:
+            Dict with price, currencies, holder_count and holders keys, each
+            to be passed as prefetched to the matching get_* method. A call
+            that returned an error yields a ValueError instance. A key is
+            None when its call was not batched, or when the server rejected
+            the batch as a whole, so the get_* method makes the call itself.
+        """
+        token_params = {"blockchain": blockchain, "contractAddress": contract}
+        calls = {"price": ("ankr_getTokenPrice", token_params)}
+        if holder_count:
+            calls["holder_count"] = ("ankr_getTokenHoldersCount", token_params)
+        if holders_page_size:
+            calls["holders"] = ("ankr_getTokenHolders", _holders_params(contract, blockchain, holders_page_size, None))
+        if not self.is_currencies_cached(blockchain):
+            calls["currencies"] = ("ankr_getCurrencies", {"blockchain": blockchain})
+
+        prefetched = dict.fromkeys(("price", "currencies", "holder_count", "holders"))
+        try:
+            results = self.batch_call(list(calls.values()))
+        except (httpx.HTTPError, ValueError) as e:
+            # Not every endpoint accepts array payloads; fall back to one call per method
+            logger.warning(f"Batch request failed, making individual calls: {e}")
+            return prefetched
+
+        prefetched.update(zip(calls, results))
+        return prefetched
+
+    def _resolve(
+        self, method: str, params: dict[str, Any], prefetched: Any = None, cache_ttl: float = 0
+    ) -> dict[str, Any]:
+        """Return a prefetched batch result, or make the call if none was given."""
+        if prefetched is None:
+            return self._call(method, params, cache_ttl)
+        if isinstance(prefetched, Exception):
+            raise prefetched
+        if cache_ttl > 0:
+            _write_cache(_cache_path(method, params), prefetched)
+        return prefetched
+
+    def get_token_holders_count(
+        self, contract: str, blockchain: str = "bsc", prefetched: Any = None
+    ) -> int:
         """
         Get the number of token holders.
 
         Args:
             contract: Token contract address
             blockchain: Blockchain name (bsc, eth, polygon, etc.)
+            prefetched: Optional result already fetched via batch_call
 
         Returns:
             Number of token holders
         """
-        result = self._call(
+        result = self._resolve(
             "ankr_getTokenHoldersCount",
             {"blockchain": blockchain, "contractAddress": contract},
+            prefetched,
         )
         return int(result.get("holderCount", 0))
 
@@ -153,6 +503,9 @@ class AnkrClient:
         blockchain: str = "bsc",
         page_size: int = PAGE_SIZE,
         page_token: Optional[str] = None,
+        prefetched: Any = None,
+        resolve_labels: bool = True,
+        cache_ttl: float = 0,
     ) -> tuple[list[TokenHolder], Optional[str]]:
         """
         Get a page of token holders.
@@ -162,32 +515,84 @@ class AnkrClient:
             blockchain: Blockchain name
             page_size: Number of holders per page
             page_token: Pagination token
+            prefetched: Optional result already fetched via batch_call
+            resolve_labels: Look up known labels (skip for bulk fetches, see annotate_labels)
+            cache_ttl: Seconds to reuse a cached copy of this page (0 disables)
 
         Returns:
             Tuple of (holders list, next page token)
         """
-        params = {
-            "blockchain": blockchain,
-            "contractAddress": contract,
-            "pageSize": page_size,
-        }
-        if page_token:
-            params["pageToken"] = page_token
+        params = _holders_params(contract, blockchain, page_size, page_token)
+        result = self._resolve("ankr_getTokenHolders", params, prefetched, cache_ttl)
+        return _parse_holders(result, resolve_labels)
 
-        result = self._call("ankr_getTokenHolders", params)
+    def get_token_holders_raw(
+        self,
+        contract: str,
+        blockchain: str = "bsc",
+        page_size: int = PAGE_SIZE,
+        page_token: Optional[str] = None,
+        resolve_labels: bool = True,
+        cache_ttl: float = 0,
+    ) -> tuple[list[dict[str, str]], Optional[str]]:
+        """
+        Get a page of token holders as plain dicts.
 
-        holders = [
-            TokenHolder(
-                address=h.get("holderAddress", ""),
-                balance=h.get("balance", "0"),
-                balance_raw=h.get("balanceRawInteger", "0"),
-                label=get_holder_label(h.get("holderAddress", "")),
-            )
-            for h in result.get("holders", [])
-        ]
+        Skips TokenHolder construction; each dict already has the snapshot
+        keys (address, balance, balance_raw, label). With resolve_labels
+        False the label is left empty.
+
+        Returns:
+            Tuple of (holder dicts, next page token)
+        """
+        params = _holders_params(contract, blockchain, page_size, page_token)
+        result = self._call("ankr_getTokenHolders", params, cache_ttl)
+        return _parse_holders_raw(result, resolve_labels)
+
+    def iter_all_holders(
+        self,
+        contract: str,
+        blockchain: str = "bsc",
+        raw: bool = False,
+        resolve_labels: bool = True,
+        cache_ttl: float = 0,
+    ) -> Iterator[list]:
+        """
+        Iterate over all token holder pages.
+
+        The next page is requested on the client's worker thread as soon as
+        its token is known, so it is in flight while the current page is
+        parsed and consumed.
+
+        Args:
+            contract: Token contract address
+            blockchain: Blockchain name
+            raw: Yield snapshot-ready dicts instead of TokenHolder objects
+            resolve_labels: Look up known labels for each holder
+            cache_ttl: Seconds to reuse cached pages, so a failed run can resume (0 disables)
+
+        Yields:
+            One list of holders per page
+        """
+        parse_page = _parse_holders_raw if raw else _parse_holders
+        executor = self._get_executor()
+
+        def fetch(page_token: Optional[str]) -> Future:
+            params = _holders_params(contract, blockchain, PAGE_SIZE, page_token)
+            return executor.submit(self._call, "ankr_getTokenHolders", params, cache_ttl)
 
-        next_token = result.get("nextPageToken")
-        return holders, next_token
+        next_future = fetch(None)
+        try:
+            while next_future is not None:
+                result = next_future.result()
+                page_token = result.get("nextPageToken")
+                next_future = fetch(page_token) if page_token and result.get("holders") else None
+
+                holders, _ = parse_page(result, resolve_labels)
+                yield holders
+        finally:
+            if next_future is not None:
+                next_future.cancel()
 
     def get_all_holders(
         self, contract: str, blockchain: str = "bsc", progress_callback=None
@@ -203,38 +608,33 @@ class AnkrClient:
         Returns:
             List of all token holders
         """
-        all_holders = []
-        page_token = None
-
-        while True:
-            holders, page_token = self.get_token_holders(
-                contract, blockchain, page_token=page_token
-            )
-            all_holders.extend(holders)
+        return _collect_pages(self.iter_all_holders(contract, blockchain), progress_callback)
 
-            if progress_callback:
-                progress_callback(len(all_holders))
-
-            if not page_token or not holders:
-                break
-
-        return all_holders
-
-    def get_token_price(self, contract: str, blockchain: str = "bsc") -> Optional[float]:
+    def get_token_price(
+        self,
+        contract: str,
+        blockchain: str = "bsc",
+        prefetched: Any = None,
+        cache_ttl: float = PRICE_CACHE_TTL,
+    ) -> Optional[float]:
         """
         Get token price in USD.
 
         Args:
             contract: Token contract address
             blockchain: Blockchain name
+            prefetched: Optional result already fetched via batch_call
+            cache_ttl: Seconds to reuse a cached price (0 disables)
 
         Returns:
             Price in USD or None if not available
         """
         try:
-            result = self._call(
+            result = self._resolve(
                 "ankr_getTokenPrice",
                 {"blockchain": blockchain, "contractAddress": contract},
+                prefetched,
+                cache_ttl,
             )
             return float(result.get("usdPrice", 0))
         except Exception as e:
@@ -297,7 +697,7 @@ class AnkrClient:
         return result.get("transfers", [])
 
     def get_token_metadata(
-        self, contract: str, blockchain: str = "bsc"
+        self, contract: str, blockchain: str = "bsc", prefetched: Any = None
     ) -> Optional[TokenMetadata]:
         """
         Get token metadata (name, symbol, decimals).
@@ -305,32 +705,248 @@ class AnkrClient:
         Args:
             contract: Token contract address
             blockchain: Blockchain name
+            prefetched: Optional result already fetched via batch_call
 
         Returns:
             TokenMetadata or None if not available
         """
         try:
-            result = self._call(
-                "ankr_getCurrencies",
-                {"blockchain": blockchain},
+            currency = self._get_currencies(blockchain, prefetched).get(contract.lower())
+            if currency is None:
+                # If not found, try to get from account balance (fallback)
+                logger.debug(f"Token {contract} not in currencies, trying balance lookup")
+                return None
+            return _metadata_from_currency(currency, contract, blockchain)
+
+        except Exception as e:
+            logger.warning(f"Could not fetch token metadata: {e}")
+            return None
+
+    def is_currencies_cached(self, blockchain: str) -> bool:
+        """
+        Check whether the currency list for a chain can be served without a request.
+
+        A fresh on-disk cache entry is loaded into memory as a side effect.
+        """
+        if blockchain not in self._currencies:
+            result = _read_cache(_cache_path("ankr_getCurrencies", {"blockchain": blockchain}), CURRENCIES_CACHE_TTL)
+            if result is None:
+                return False
+            self._currencies[blockchain] = _index_currencies(result)
+        return True
+
+    def _get_currencies(self, blockchain: str, prefetched: Any = None) -> dict[str, dict[str, Any]]:
+        """
+        Get the chain's currencies keyed by lowercase address.
+
+        The ankr_getCurrencies list is large and rarely changes, so it is
+        kept per client and in CACHE_DIR for CURRENCIES_CACHE_TTL seconds.
+        """
+        if blockchain in self._currencies or (prefetched is None and self.is_currencies_cached(blockchain)):
+            return self._currencies[blockchain]
+
+        result = self._resolve(
+            "ankr_getCurrencies", {"blockchain": blockchain}, prefetched, CURRENCIES_CACHE_TTL
+        )
+
+        self._currencies[blockchain] = _index_currencies(result)
+        return self._currencies[blockchain]
+
+
+_shared_client: Optional[AnkrClient] = None
+_shared_client_lock = threading.Lock()
+
+
+def get_shared_client() -> AnkrClient:
+    """
+    Get the process-wide AnkrClient, creating it on first use.
+
+    Sharing one client keeps its connection pool and currency cache warm
+    across commands run in the same process.
+    """
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = AnkrClient()
+        return _shared_client
+
+
+def close_shared_client():
+    """Close and forget the process-wide AnkrClient, if one was created."""
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is not None:
+            _shared_client.close()
+            _shared_client = None
+
+
+class AsyncAnkrClient:
+    """
+    Asyncio client for Ankr Token API.
+
+    Keeps one HTTP/2 connection open so independent calls can run
+    concurrently and holder pages can be prefetched while the previous
+    page is being processed.
+    """
+
+    def __init__(self, rpc_url: Optional[str] = None, transport: Optional[httpx.AsyncBaseTransport] = None):
+        """Initialize the async Ankr client (see AnkrClient for the arguments)."""
+        self.rpc_url = rpc_url or ANKR_RPC_URL
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._request_ids = itertools.count(1)
+        self._currencies: dict[str, dict[str, dict[str, Any]]] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get or create HTTP client."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                limits=_HTTP_LIMITS,
+                headers={"Content-Type": "application/json"},
+                timeout=REQUEST_TIMEOUT,
+                transport=self._transport,
             )
+        return self._client
+
+    async def aclose(self):
+        """Close the HTTP client."""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def _call(self, method: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Make a JSON-RPC call to Ankr API."""
+        payload = _rpc_payload(next(self._request_ids), method, params)
+
+        client = self._get_client()
+        response = await client.post(self.rpc_url, content=payload)
+        response.raise_for_status()
+
+        data = jsonio.loads(response.content)
+        if "error" in data:
+            logger.error(f"Ankr API error: {data['error']}")
+            raise ValueError(f"Ankr API error: {data['error']}")
+
+        return data.get("result", {})
+
+    async def get_token_holders_count(self, contract: str, blockchain: str = "bsc") -> int:
+        """Get the number of token holders."""
+        result = await self._call(
+            "ankr_getTokenHoldersCount",
+            {"blockchain": blockchain, "contractAddress": contract},
+        )
+        return int(result.get("holderCount", 0))
+
+    async def get_token_holders(
+        self,
+        contract: str,
+        blockchain: str = "bsc",
+        page_size: int = PAGE_SIZE,
+        page_token: Optional[str] = None,
+        resolve_labels: bool = True,
+    ) -> tuple[list[TokenHolder], Optional[str]]:
+        """Get a page of token holders."""
+        params = _holders_params(contract, blockchain, page_size, page_token)
+        result = await self._call("ankr_getTokenHolders", params)
+        return _parse_holders(result, resolve_labels)
+
+    async def iter_all_holders(
+        self, contract: str, blockchain: str = "bsc", raw: bool = False, resolve_labels: bool = True
+    ) -> AsyncIterator[list]:
+        """
+        Iterate over all token holder pages.
+
+        The next page is requested as soon as its token is known, so it is
+        in flight while the current page is parsed and consumed.
+
+        Args:
+            contract: Token contract address
+            blockchain: Blockchain name
+            raw: Yield snapshot-ready dicts instead of TokenHolder objects
+            resolve_labels: Look up known labels for each holder
+
+        Yields:
+            One list of holders per page
+        """
+        parse_page = _parse_holders_raw if raw else _parse_holders
+
+        def fetch(page_token: Optional[str]):
+            params = _holders_params(contract, blockchain, PAGE_SIZE, page_token)
+            return asyncio.create_task(self._call("ankr_getTokenHolders", params))
 
-            # Find the token in currencies list
-            for currency in result.get("currencies", []):
-                if currency.get("address", "").lower() == contract.lower():
-                    return TokenMetadata(
-                        contract=contract,
-                        blockchain=blockchain,
-                        name=currency.get("name", "Unknown"),
-                        symbol=currency.get("symbol", "???"),
-                        decimals=int(currency.get("decimals", 18)),
-                    )
-
-            # If not found, try to get from account balance (fallback)
-            logger.debug(f"Token {contract} not in currencies, trying balance lookup")
+        next_task = fetch(None)
+        try:
+            while next_task is not None:
+                result = await next_task
+                page_token = result.get("nextPageToken")
+                next_task = fetch(page_token) if page_token and result.get("holders") else None
+                if next_task:
+                    # Let the next request go out before parsing this page
+                    await asyncio.sleep(0)
+
+                holders, _ = parse_page(result, resolve_labels)
+                yield holders
+        finally:
+            if next_task is not None:
+                next_task.cancel()
+
+    async def get_all_holders(
+        self,
+        contract: str,
+        blockchain: str = "bsc",
+        progress_callback=None,
+    ) -> list[TokenHolder]:
+        """
+        Get all token holders with pipelined pagination.
+
+        Args:
+            contract: Token contract address
+            blockchain: Blockchain name
+            progress_callback: Optional callback(count) for progress updates
+
+        Returns:
+            List of all token holders
+        """
+        return await _acollect_pages(self.iter_all_holders(contract, blockchain), progress_callback)
+
+    async def get_token_price(self, contract: str, blockchain: str = "bsc") -> Optional[float]:
+        """Get token price in USD, or None if not available."""
+        try:
+            result = await self._call(
+                "ankr_getTokenPrice",
+                {"blockchain": blockchain, "contractAddress": contract},
+            )
+            return float(result.get("usdPrice", 0))
+        except Exception as e:
+            logger.warning(f"Could not fetch token price: {e}")
             return None
 
+    async def get_token_metadata(
+        self, contract: str, blockchain: str = "bsc"
+    ) -> Optional[TokenMetadata]:
+        """Get token metadata (name, symbol, decimals), or None if not available."""
+        try:
+            currencies = self._currencies.get(blockchain)
+            if currencies is None:
+                result = await self._call(
+                    "ankr_getCurrencies",
+                    {"blockchain": blockchain},
+                )
+                currencies = self._currencies[blockchain] = _index_currencies(result)
+
+            currency = currencies.get(contract.lower())
+            if currency is None:
+                logger.debug(f"Token {contract} not in currencies")
+                return None
+            return _metadata_from_currency(currency, contract, blockchain)
+
         except Exception as e:
             logger.warning(f"Could not fetch token metadata: {e}")
             return None
-
@@ -55,5 +55,16 @@ EXAMPLE_TOKENS = {
 # =============================================================================
 
 REQUEST_TIMEOUT = 30  # seconds (Ankr can be slow for large queries)
+HTTP_MAX_CONNECTIONS = 20  # connection pool size (HTTP/2 multiplexes over these)
+HTTP_KEEPALIVE_EXPIRY = 60  # seconds an idle connection is kept open
 PAGE_SIZE = 10000  # Max holders per page
 SNAPSHOT_DIR = Path("snapshots")
+ZSTD_LEVEL = 3  # snapshot compression level (fast, ~3-5x smaller than plain JSON)
+
+# =============================================================================
+# Cache Settings
+# =============================================================================
+
+CACHE_DIR = SNAPSHOT_DIR / ".cache"
+CURRENCIES_CACHE_TTL = int(os.getenv("CURRENCIES_CACHE_TTL", 6 * 60 * 60))  # seconds, 0 disables
+PRICE_CACHE_TTL = int(os.getenv("PRICE_CACHE_TTL", 60))  # seconds, 0 disables
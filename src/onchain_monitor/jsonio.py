@@ -0,0 +1,31 @@
+"""
+JSON encoding helpers for On-chain Monitor.
+
+Uses orjson when it is installed and falls back to the standard library
+json module otherwise. Both paths work with bytes.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """Encode an object as UTF-8 JSON bytes, optionally indented by 2 spaces."""
+    if orjson is not None:
+        option = (orjson.OPT_INDENT_2 if indent else 0) | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, indent=2, sort_keys=sort_keys).encode()
+    return json.dumps(obj, separators=(",", ":"), sort_keys=sort_keys).encode()
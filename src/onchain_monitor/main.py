@@ -15,19 +15,20 @@ Usage:
 import logging
 import sys
 from datetime import datetime
+from decimal import Decimal
 from pathlib import Path
 
-from onchain_monitor.ankr_client import AnkrClient
+from onchain_monitor.ankr_client import AnkrClient, close_shared_client, get_shared_client
 from onchain_monitor.config import LOG_FILE, LOG_LEVEL, SUPPORTED_CHAINS
 from onchain_monitor.snapshot import create_holders_snapshot
 
 
-def setup_logging():
+def setup_logging(debug: bool = False):
     """Configure logging for the application."""
     LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
 
     logging.basicConfig(
-        level=getattr(logging, LOG_LEVEL.upper()),
+        level=logging.DEBUG if debug else getattr(logging, LOG_LEVEL.upper()),
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         handlers=[
             logging.FileHandler(LOG_FILE),
@@ -67,10 +68,10 @@ def get_token_display_name(client: AnkrClient, contract: str, chain: str) -> str
     return contract[:20] + "..."
 
 
-def cmd_snapshot(contract: str, chain: str = "bsc"):
-    """Create a holder snapshot."""
-    with AnkrClient() as client:
-        token_name = get_token_display_name(client, contract, chain)
+def cmd_snapshot(contract: str, chain: str = "bsc", debug: bool = False):
+    """Create a holder snapshot (indented plain JSON in debug mode)."""
+    client = get_shared_client()
+    token_name = get_token_display_name(client, contract, chain)
 
     print_header(f"Holder Snapshot ({chain})", token_name)
     print(f"  Contract: {contract}")
@@ -81,7 +82,7 @@ def cmd_snapshot(contract: str, chain: str = "bsc"):
         print(f"  Fetched {count} holders...", end="\r")
 
     snapshot = create_holders_snapshot(
-        contract, chain, progress_callback=progress
+        contract, chain, client=client, progress_callback=progress, pretty=debug
     )
 
     print()
@@ -93,67 +94,78 @@ def cmd_snapshot(contract: str, chain: str = "bsc"):
     print_footer()
 
 
-def cmd_holders(contract: str, chain: str = "bsc", limit: int = 20):
+def cmd_holders(contract: str, chain: str = "bsc", limit: int = 20, debug: bool = False):
     """Show top token holders."""
-    with AnkrClient() as client:
-        token_name = get_token_display_name(client, contract, chain)
-        print_header(f"Top Holders ({chain})", token_name)
-        print(f"  Contract: {contract}")
-        print()
+    client = get_shared_client()
+    token_name = get_token_display_name(client, contract, chain)
+    print_header(f"Top Holders ({chain})", token_name)
+    print(f"  Contract: {contract}")
+    print()
 
-        holders, _ = client.get_token_holders(contract, chain, page_size=limit)
-        price = client.get_token_price(contract, chain)
+    holders, _ = client.get_token_holders(contract, chain, page_size=limit)
+    price = client.get_token_price(contract, chain)
 
-        print(f"  {'#':<4} {'Address':<44} {'Balance':<18} {'Label':<20}")
-        print("  " + "-" * 86)
+    # Rank by the exact integer balance; float() misorders large 18-decimal balances
+    holders.sort(key=lambda h: h.balance_int, reverse=True)
 
-        for i, h in enumerate(holders[:limit], 1):
-            balance = float(h.balance) if h.balance else 0
-            label = h.label if h.label else ""
-            addr_display = h.address[:42]
-            print(f"  {i:<4} {addr_display:<44} {balance:>16,.2f}  {label:<20}")
+    print(f"  {'#':<4} {'Address':<44} {'Balance':<18} {'Label':<20}")
+    print("  " + "-" * 86)
 
-        if price:
-            print()
-            print(f"  Token price: ${price:.6f}")
+    for i, h in enumerate(holders[:limit], 1):
+        balance = Decimal(h.balance) if h.balance else Decimal(0)
+        label = h.label if h.label else ""
+        addr_display = h.address[:42]
+        print(f"  {i:<4} {addr_display:<44} {balance:>16,.2f}  {label:<20}")
+
+    if price:
+        print()
+        print(f"  Token price: ${price:.6f}")
 
     print_footer()
 
 
-def cmd_basic(contract: str, chain: str = "bsc"):
+def cmd_basic(contract: str, chain: str = "bsc", debug: bool = False):
     """Get basic token info (fast, immediate data)."""
-    with AnkrClient() as client:
-        print_header(f"Token Info ({chain})")
-        print(f"  Contract: {contract}")
-        print()
+    client = get_shared_client()
+    print_header(f"Token Info ({chain})")
+    print(f"  Contract: {contract}")
+    print()
+
+    # Metadata, price and top holder preview in a single round trip
+    prefetched = client.prefetch_token_info(contract, chain, holders_page_size=5)
+
+    metadata = client.get_token_metadata(contract, chain, prefetched=prefetched["currencies"])
+    if metadata:
+        print(f"  Name: {metadata.name}")
+        print(f"  Symbol: {metadata.symbol}")
+        print(f"  Decimals: {metadata.decimals}")
 
-        # Get metadata first (fast)
-        metadata = client.get_token_metadata(contract, chain)
-        if metadata:
-            print(f"  Name: {metadata.name}")
-            print(f"  Symbol: {metadata.symbol}")
-            print(f"  Decimals: {metadata.decimals}")
-
-        # Get price (fast)
-        price = client.get_token_price(contract, chain)
-        if price:
-            print(f"  Price: ${price:.6f}")
-        else:
-            print("  Price: Not available")
-
-        # Get top holder preview (fast - just 1 page)
-        holders, _ = client.get_token_holders(contract, chain, page_size=5)
-        if holders:
-            print()
-            print("  Top 5 Holders:")
-            for i, h in enumerate(holders[:5], 1):
-                balance = float(h.balance) if h.balance else 0
-                label = f" ({h.label})" if h.label else ""
-                print(f"    {i}. {h.address[:20]}... {balance:,.0f}{label}")
+    price = client.get_token_price(contract, chain, prefetched=prefetched["price"])
+    if price:
+        print(f"  Price: ${price:.6f}")
+    else:
+        print("  Price: Not available")
+
+    holders, _ = client.get_token_holders(contract, chain, page_size=5, prefetched=prefetched["holders"])
+    if holders:
+        print()
+        print("  Top 5 Holders:")
+        for i, h in enumerate(holders[:5], 1):
+            balance = Decimal(h.balance) if h.balance else Decimal(0)
+            label = f" ({h.label})" if h.label else ""
+            print(f"    {i}. {h.address[:20]}... {balance:,.0f}{label}")
 
     print_footer()
 
 
+# CLI command table: name -> handler(contract, chain, debug=...)
+COMMANDS = {
+    "snapshot": cmd_snapshot,
+    "holders": cmd_holders,
+    "basic": cmd_basic,
+}
+
+
 def print_help():
     """Print usage help."""
     print("""
@@ -164,6 +176,9 @@ Usage:
   onchain-monitor holders <contract> [chain]    Show top holders
   onchain-monitor snapshot <contract> [chain]   Create holder snapshot (slow)
 
+Options:
+  --debug    Debug logging; snapshots written as indented .json instead of .json.zst
+
 Examples:
   onchain-monitor basic 0x000Ae314E2A2172a039B26378814C252734f556A bsc
   onchain-monitor holders 0xdAC17F958D2ee523a2206206994597C13D831ec7 eth
@@ -175,45 +190,45 @@ Supported chains: bsc, eth, polygon, arbitrum, base, avalanche
 
 def main():
     """Main entry point."""
-    setup_logging()
+    args = [arg for arg in sys.argv[1:] if arg != "--debug"]
+    debug = len(args) < len(sys.argv) - 1
+
+    setup_logging(debug)
     logger = logging.getLogger(__name__)
 
-    if len(sys.argv) < 2:
+    if len(args) < 1:
         print_help()
         return
 
-    command = sys.argv[1].lower()
+    command = args[0].lower()
 
     if command in ["help", "-h", "--help"]:
         print_help()
         return
 
-    if len(sys.argv) < 3:
+    if len(args) < 2:
         print("Error: Contract address required")
         print_help()
         sys.exit(1)
 
-    contract = sys.argv[2]
-    chain = sys.argv[3] if len(sys.argv) > 3 else "bsc"
+    contract = args[1]
+    chain = args[2] if len(args) > 2 else "bsc"
 
     if chain not in SUPPORTED_CHAINS:
         print(f"Error: Unsupported chain '{chain}'")
         print(f"Supported: {', '.join(SUPPORTED_CHAINS)}")
         sys.exit(1)
 
+    handler = COMMANDS.get(command)
+    if handler is None:
+        print(f"Unknown command: {command}")
+        print_help()
+        sys.exit(1)
+
     logger.info(f"Running {command} for {contract} on {chain}")
 
     try:
-        if command == "snapshot":
-            cmd_snapshot(contract, chain)
-        elif command == "holders":
-            cmd_holders(contract, chain)
-        elif command == "basic":
-            cmd_basic(contract, chain)
-        else:
-            print(f"Unknown command: {command}")
-            print_help()
-            sys.exit(1)
+        handler(contract, chain, debug=debug)
 
     except Exception as e:
         logger.error(f"Command failed: {e}")
@@ -221,6 +236,9 @@ def main():
         print()
         sys.exit(1)
 
+    finally:
+        close_shared_client()
+
 
 if __name__ == "__main__":
     main()
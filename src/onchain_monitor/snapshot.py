@@ -1,22 +1,42 @@
 """
 Snapshot module for creating token holder snapshots.
 
-Creates timestamped JSON files of token holder data for analysis.
+Creates timestamped, zstd-compressed JSON files of token holder data
+for analysis.
 """
 
-import json
+import asyncio
 import logging
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-from onchain_monitor.ankr_client import AnkrClient, TokenHolder
-from onchain_monitor.config import SNAPSHOT_DIR
+import zstandard as zstd
+
+from onchain_monitor import analytics, jsonio
+from onchain_monitor.ankr_client import AnkrClient, AsyncAnkrClient, TokenMetadata, annotate_label_dicts
+from onchain_monitor.config import SNAPSHOT_DIR, ZSTD_LEVEL
 
 logger = logging.getLogger(__name__)
 
 
-def save_snapshot(data: dict, label: str, output_dir: Optional[Path] = None) -> Path:
+def _snapshot_path(label: str, output_dir: Optional[Path] = None, compress: bool = True) -> Path:
+    """Build a timestamped snapshot file path, creating the directory if needed."""
+    output_dir = output_dir or SNAPSHOT_DIR
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    suffix = ".json.zst" if compress else ".json"
+    return output_dir / f"{label}_{timestamp}{suffix}"
+
+
+def save_snapshot(
+    data: dict,
+    label: str,
+    output_dir: Optional[Path] = None,
+    pretty: bool = False,
+    compress: bool = True,
+) -> Path:
     """
     Save a snapshot to a JSON file.
 
@@ -24,40 +44,171 @@ def save_snapshot(data: dict, label: str, output_dir: Optional[Path] = None) ->
         data: Snapshot data
         label: Label for the snapshot file
         output_dir: Output directory (defaults to SNAPSHOT_DIR)
+        pretty: Indent the JSON (for debugging; roughly doubles the size)
+        compress: Write zstd-compressed .json.zst instead of plain .json
 
     Returns:
         Path to the saved file
     """
-    output_dir = output_dir or SNAPSHOT_DIR
-    output_dir.mkdir(parents=True, exist_ok=True)
+    filename = _snapshot_path(label, output_dir, compress)
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = output_dir / f"{label}_{timestamp}.json"
-
-    with open(filename, "w") as f:
-        json.dump(data, f, indent=2)
+    with open(filename, "wb") as f:
+        out = zstd.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(f, closefd=False) if compress else f
+        out.write(jsonio.dumps(data, indent=pretty))
+        if compress:
+            out.close()
 
     logger.info(f"Snapshot saved: {filename}")
     return filename
 
 
+class SnapshotWriter:
+    """
+    Write a snapshot JSON file incrementally, one holder page at a time.
+
+    The header fields are written first, holders are appended as pages
+    arrive and holder_count is written last, so memory use is bounded by
+    the page size rather than the number of holders. The file is written
+    under a .part name and only renamed into place once it is complete.
+    When NumPy is installed a .balances.npy sidecar is streamed alongside
+    it (see analytics.BalancesWriter).
+
+    Output is compact zstd-compressed JSON by default; pretty writes an
+    indented plain .json file for debugging instead.
+
+    With resolve_labels set, known labels are filled in page by page as
+    holders are written, so they can be fetched without labels.
+    """
+
+    def __init__(
+        self,
+        header: dict,
+        label: str,
+        output_dir: Optional[Path] = None,
+        resolve_labels: bool = False,
+        pretty: bool = False,
+    ):
+        """Open the snapshot file and write the header fields."""
+        self.path = _snapshot_path(label, output_dir, compress=not pretty)
+        self.holder_count = 0
+        self._resolve_labels = resolve_labels
+        self._pretty = pretty
+        self._separator = b",\n    " if pretty else b","
+        self._part_path = self.path.with_name(self.path.name + ".part")
+        self._file = open(self._part_path, "wb")
+        self._balances = None
+        try:
+            if analytics.np is not None:
+                self._balances = analytics.BalancesWriter(self.path)
+            if not pretty:
+                self._file = zstd.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(self._file)
+
+            # Reopen the header object (drop its closing "}") to append the holders array
+            if pretty:
+                self._file.write(jsonio.dumps(header, indent=True)[:-2] + b',\n  "holders": [')
+            else:
+                self._file.write(jsonio.dumps(header)[:-1] + b',"holders":[')
+        except BaseException:
+            self.abort()
+            raise
+
+    def write_page(self, holders: list[dict[str, str]]):
+        """Append a page of holder dicts."""
+        if not holders:
+            return
+
+        if self._resolve_labels:
+            annotate_label_dicts(holders)
+
+        # One write per page keeps compressor calls off the per-holder path
+        lead = self._separator if self.holder_count else (b"\n    " if self._pretty else b"")
+        self._file.write(lead + self._separator.join(map(jsonio.dumps, holders)))
+        self.holder_count += len(holders)
+
+        if self._balances is not None:
+            self._balances.write(holders)
+
+    def close(self) -> Path:
+        """Finish the JSON document and sidecar, then move the JSON into place."""
+        try:
+            if self._pretty:
+                self._file.write(b'\n  ],\n  "holder_count": %d\n}\n' % self.holder_count)
+            else:
+                self._file.write(b'],"holder_count":%d}' % self.holder_count)
+            self._file.close()
+
+            # Sidecar first, so a published snapshot always has its balances
+            if self._balances is not None:
+                self._balances.close()
+            self._part_path.replace(self.path)
+        except BaseException:
+            self.abort()
+            if self._balances is not None:
+                self._balances.path.unlink(missing_ok=True)
+            raise
+
+        logger.info(f"Snapshot saved: {self.path}")
+        return self.path
+
+    def abort(self):
+        """Discard a partially written snapshot."""
+        self._file.close()
+        self._part_path.unlink(missing_ok=True)
+        if self._balances is not None:
+            self._balances.abort()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def _snapshot_header(
+    contract: str,
+    blockchain: str,
+    metadata: Optional[TokenMetadata],
+    price: Optional[float],
+) -> dict:
+    """Build the snapshot fields that precede the holders list."""
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "contract": contract,
+        "blockchain": blockchain,
+        "token_name": metadata.name if metadata else "Unknown",
+        "token_symbol": metadata.symbol if metadata else "???",
+        "price_usd": price,
+    }
+
+
 def create_holders_snapshot(
     contract: str,
     blockchain: str = "bsc",
     client: Optional[AnkrClient] = None,
     progress_callback=None,
+    page_cache_ttl: float = 0,
+    pretty: bool = False,
 ) -> dict:
     """
     Create a full snapshot of all token holders.
 
+    Holders are streamed to the snapshot file page by page and are not
+    kept in memory.
+
     Args:
         contract: Token contract address
         blockchain: Blockchain name
         client: Optional AnkrClient (creates one if not provided)
         progress_callback: Optional callback for progress updates
+        page_cache_ttl: Seconds to cache holder pages on disk, so a rerun
+            after a failure skips pages already fetched (0 disables)
+        pretty: Write indented, uncompressed JSON (for debugging)
 
     Returns:
-        Snapshot data dict
+        Snapshot summary dict (snapshot fields without the holders list)
     """
     should_close = False
     if client is None:
@@ -65,57 +216,107 @@ def create_holders_snapshot(
         should_close = True
 
     try:
-        # Get holder count first
-        holder_count = client.get_token_holders_count(contract, blockchain)
+        # Fetch metadata, price and holder count in one round trip
+        prefetched = client.prefetch_token_info(contract, blockchain, holder_count=True)
+
+        holder_count = client.get_token_holders_count(contract, blockchain, prefetched=prefetched["holder_count"])
         logger.info(f"Token has {holder_count} holders")
 
         # Get token metadata
-        metadata = client.get_token_metadata(contract, blockchain)
-        token_name = metadata.name if metadata else "Unknown"
-        token_symbol = metadata.symbol if metadata else "???"
-
-        # Get all holders
-        holders = client.get_all_holders(
-            contract, blockchain, progress_callback=progress_callback
-        )
+        metadata = client.get_token_metadata(contract, blockchain, prefetched=prefetched["currencies"])
 
         # Get token price
-        price = client.get_token_price(contract, blockchain)
-
-        # Build snapshot with token info and labels
-        snapshot = {
-            "timestamp": datetime.now().isoformat(),
-            "contract": contract,
-            "blockchain": blockchain,
-            "token_name": token_name,
-            "token_symbol": token_symbol,
-            "holder_count": len(holders),
-            "price_usd": price,
-            "holders": [
-                {
-                    "address": h.address,
-                    "balance": h.balance,
-                    "balance_raw": h.balance_raw,
-                    "label": h.label,
-                }
-                for h in holders
-            ],
-        }
+        price = client.get_token_price(contract, blockchain, prefetched=prefetched["price"])
+
+        # Stream all holders to the snapshot file
+        header = _snapshot_header(contract, blockchain, metadata, price)
+        with SnapshotWriter(header, f"holders_{blockchain}", resolve_labels=True, pretty=pretty) as writer:
+            pages = client.iter_all_holders(
+                contract, blockchain, raw=True, resolve_labels=False, cache_ttl=page_cache_ttl
+            )
+            for holders in pages:
+                writer.write_page(holders)
 
-        # Save snapshot
-        save_snapshot(snapshot, f"holders_{blockchain}")
+                if progress_callback:
+                    progress_callback(writer.holder_count)
 
-        return snapshot
+        return {**header, "holder_count": writer.holder_count}
 
     finally:
         if should_close:
             client.close()
 
 
+async def create_holders_snapshot_async(
+    contract: str,
+    blockchain: str = "bsc",
+    client: Optional[AsyncAnkrClient] = None,
+    progress_callback=None,
+    pretty: bool = False,
+) -> dict:
+    """
+    Create a full snapshot of all token holders using the async client.
+
+    Metadata, price, holder count and the first holders page are fetched
+    concurrently, then holders are streamed to disk while each next page
+    is already in flight.
+
+    Args:
+        contract: Token contract address
+        blockchain: Blockchain name
+        client: Optional AsyncAnkrClient (creates one if not provided)
+        progress_callback: Optional callback for progress updates
+        pretty: Write indented, uncompressed JSON (for debugging)
+
+    Returns:
+        Snapshot summary dict (snapshot fields without the holders list)
+    """
+    should_close = False
+    if client is None:
+        client = AsyncAnkrClient()
+        should_close = True
+
+    pages = client.iter_all_holders(contract, blockchain, raw=True, resolve_labels=False)
+    # Request the first holders page alongside the header calls, not after them
+    first_page = asyncio.ensure_future(anext(pages, []))
+    try:
+        metadata, price, holder_count = await asyncio.gather(
+            client.get_token_metadata(contract, blockchain),
+            client.get_token_price(contract, blockchain),
+            client.get_token_holders_count(contract, blockchain),
+        )
+        logger.info(f"Token has {holder_count} holders")
+
+        header = _snapshot_header(contract, blockchain, metadata, price)
+        with SnapshotWriter(header, f"holders_{blockchain}", resolve_labels=True, pretty=pretty) as writer:
+            writer.write_page(await first_page)
+            if progress_callback:
+                progress_callback(writer.holder_count)
+
+            async for holders in pages:
+                writer.write_page(holders)
+
+                if progress_callback:
+                    progress_callback(writer.holder_count)
+
+        return {**header, "holder_count": writer.holder_count}
+
+    finally:
+        # If the header calls failed, stop the first-page fetch before closing the generator
+        first_page.cancel()
+        await asyncio.gather(first_page, return_exceptions=True)
+        await pages.aclose()
+        if should_close:
+            await client.aclose()
+
+
 def load_snapshot(filepath: Path) -> dict:
-    """Load a snapshot from a JSON file."""
-    with open(filepath) as f:
-        return json.load(f)
+    """Load a snapshot from a .json or zstd-compressed .json.zst file."""
+    with open(filepath, "rb") as f:
+        if Path(filepath).suffix == ".zst":
+            with zstd.ZstdDecompressor().stream_reader(f) as reader:
+                return jsonio.loads(reader.read())
+        return jsonio.loads(f.read())
 
 
 def compare_snapshots(old: dict, new: dict) -> dict:
@@ -127,20 +328,23 @@ def compare_snapshots(old: dict, new: dict) -> dict:
     """
     old_addresses = {h["address"]: h for h in old.get("holders", [])}
     new_addresses = {h["address"]: h for h in new.get("holders", [])}
+    old_get = old_addresses.__getitem__
+    new_get = new_addresses.__getitem__
 
-    new_holders = [new_addresses[a] for a in new_addresses if a not in old_addresses]
-    removed_holders = [old_addresses[a] for a in old_addresses if a not in new_addresses]
-
-    balance_changes = []
-    for addr in set(old_addresses.keys()) & set(new_addresses.keys()):
-        old_bal = old_addresses[addr]["balance"]
-        new_bal = new_addresses[addr]["balance"]
-        if old_bal != new_bal:
-            balance_changes.append({
-                "address": addr,
-                "old_balance": old_bal,
-                "new_balance": new_bal,
-            })
+    # Membership tests against the other dict keep snapshot (balance rank) order
+    new_holders = [h for a, h in new_addresses.items() if a not in old_addresses]
+    removed_holders = [h for a, h in old_addresses.items() if a not in new_addresses]
+
+    balance_changes = [
+        {
+            "address": addr,
+            "old_balance": old_bal,
+            "new_balance": new_bal,
+        }
+        # Dict key views support set operations directly, without copying into sets
+        for addr in new_addresses.keys() & old_addresses.keys()
+        if (old_bal := old_get(addr)["balance"]) != (new_bal := new_get(addr)["balance"])
+    ]
 
     return {
         "new_holders": new_holders,
@@ -2,8 +2,93 @@
 Pytest configuration and shared fixtures.
 """
 
+import json
+
+import httpx
 import pytest
 
+from onchain_monitor.ankr_client import AnkrClient
+
+
+class FakeAnkrRpc:
+    """
+    httpx.MockTransport handler that answers JSON-RPC calls like the Ankr API.
+
+    results maps a method name to its result, to a callable taking the
+    call's params, or to an exception (answered as a JSON-RPC error).
+    Methods not in results get default. Every call is kept in calls.
+    With reject_batches set, array payloads get a single error reply, like
+    an endpoint that does not support JSON-RPC batches.
+    """
+
+    def __init__(self):
+        self.results: dict = {}
+        self.default = None
+        self.reject_batches = False
+        self.calls: list[dict] = []
+
+    def reset(self):
+        self.results.clear()
+        self.default = None
+        self.reject_batches = False
+        self.calls.clear()
+
+    def methods(self) -> list[str]:
+        return [call["method"] for call in self.calls]
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if isinstance(body, list) and self.reject_batches:
+            return httpx.Response(200, json={"jsonrpc": "2.0", "id": None, "error": {"message": "batch not supported"}})
+        if isinstance(body, list):
+            return httpx.Response(200, json=[self._answer(call) for call in body])
+        return httpx.Response(200, json=self._answer(body))
+
+    def _answer(self, call: dict) -> dict:
+        self.calls.append(call)
+        result = self.results.get(call["method"], self.default)
+        if callable(result):
+            result = result(call["params"])
+        if isinstance(result, Exception):
+            return {"jsonrpc": "2.0", "id": call["id"], "error": {"message": str(result)}}
+        return {"jsonrpc": "2.0", "id": call["id"], "result": {} if result is None else result}
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep on-disk API caches out of the working tree and separate per test."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr("onchain_monitor.ankr_client.CACHE_DIR", cache_dir)
+    return cache_dir
+
+
+@pytest.fixture(scope="module")
+def shared_fake_rpc():
+    """Provide one fake Ankr endpoint per test module."""
+    return FakeAnkrRpc()
+
+
+@pytest.fixture(scope="module")
+def shared_ankr_client(shared_fake_rpc):
+    """Provide one AnkrClient per test module, wired to the fake endpoint."""
+    client = AnkrClient(transport=httpx.MockTransport(shared_fake_rpc))
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def fake_rpc(shared_fake_rpc):
+    """Provide the module's fake Ankr endpoint with no results or recorded calls."""
+    shared_fake_rpc.reset()
+    return shared_fake_rpc
+
+
+@pytest.fixture
+def ankr_client(shared_ankr_client, fake_rpc):
+    """Provide the module's AnkrClient with its per-client caches cleared."""
+    shared_ankr_client._currencies.clear()
+    return shared_ankr_client
+
 
 @pytest.fixture
 def mock_contract():
@@ -0,0 +1,68 @@
+"""
+Tests for the analytics module.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from onchain_monitor.analytics import holders_above, load_balances, sidecar_path, top_holder_indices
+from onchain_monitor.snapshot import SnapshotWriter
+
+np = pytest.importorskip("numpy")
+
+
+def test_snapshot_writer_emits_balances_sidecar(tmp_path):
+    """Test that streamed snapshots get a matching balances sidecar."""
+    holders = [
+        {"address": "0xHolder1", "balance": "5.5", "balance_raw": "5500", "label": ""},
+        {"address": "0xHolder2", "balance": "1", "balance_raw": "1000", "label": ""},
+    ]
+
+    with SnapshotWriter({"contract": "0xToken"}, "holders_bsc", output_dir=tmp_path) as writer:
+        writer.write_page(holders[:1])
+        writer.write_page(holders[1:])
+
+    assert sidecar_path(writer.path).exists()
+    assert load_balances(writer.path).tolist() == [5.5, 1.0]
+    assert not list(tmp_path.glob("*.part"))
+
+
+def test_snapshot_writer_discards_partial_sidecar_on_error(tmp_path):
+    """Test that an aborted snapshot leaves no sidecar or part files behind."""
+    holders = [{"address": "0xHolder1", "balance": "5.5", "balance_raw": "5500", "label": ""}]
+
+    with pytest.raises(RuntimeError):
+        with SnapshotWriter({"contract": "0xToken"}, "holders_bsc", output_dir=tmp_path) as writer:
+            writer.write_page(holders)
+            raise RuntimeError("fetch failed")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_snapshot_writer_publishes_nothing_if_sidecar_fails(tmp_path):
+    """Test that a sidecar failure on close leaves neither the snapshot nor part files behind."""
+    holders = [{"address": "0xHolder1", "balance": "5.5", "balance_raw": "5500", "label": ""}]
+
+    with patch("onchain_monitor.analytics.shutil.copyfileobj", side_effect=OSError("disk full")):
+        with pytest.raises(OSError, match="disk full"):
+            with SnapshotWriter({"contract": "0xToken"}, "holders_bsc", output_dir=tmp_path) as writer:
+                writer.write_page(holders)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_snapshot_writer_cleans_up_if_header_fails(tmp_path):
+    """Test that a writer failing in __init__ removes the part files it opened."""
+    with pytest.raises(TypeError):
+        SnapshotWriter({"contract": object()}, "holders_bsc", output_dir=tmp_path)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_top_holder_indices_and_thresholds():
+    """Test top-K selection and whale threshold counts."""
+    balances = np.array([3.0, 10.0, 1.0, 7.0])
+
+    assert top_holder_indices(balances, 2).tolist() == [1, 3]
+    assert holders_above(balances, [1.0, 5.0, 100.0]).tolist() == [4, 2, 0]
@@ -2,7 +2,12 @@
 Tests for the Ankr client module.
 """
 
-from onchain_monitor.ankr_client import AnkrClient, TokenHolder
+import ssl
+
+import httpx
+import pytest
+
+from onchain_monitor.ankr_client import AnkrClient, TokenHolder, TokenMetadata, close_shared_client, get_shared_client
 
 
 def test_token_holder_dataclass():
@@ -16,6 +21,14 @@ def test_token_holder_dataclass():
     assert holder.balance == "1000.5"
 
 
+def test_token_holder_balance_int_is_exact():
+    """Test balance_int keeps precision that float() would lose."""
+    small = TokenHolder(address="0x1", balance="", balance_raw="9007199254740993000000000")
+    large = TokenHolder(address="0x2", balance="", balance_raw="9007199254740993000000001")
+    assert float(small.balance_raw) == float(large.balance_raw)
+    assert large.balance_int - small.balance_int == 1
+
+
 def test_ankr_client_creation():
     """Test AnkrClient can be created."""
     client = AnkrClient()
@@ -23,7 +36,43 @@ def test_ankr_client_creation():
     client.close()
 
 
+def test_injected_transport_skips_ssl_setup(monkeypatch):
+    """Test a client on an injected transport never builds an SSL context."""
+
+    def no_ssl(*args, **kwargs):
+        raise AssertionError("SSL context created despite injected transport")
+
+    monkeypatch.setattr(ssl, "create_default_context", no_ssl)
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"result": {"holderCount": 1}}))
+
+    with AnkrClient(transport=transport) as client:
+        assert client.get_token_holders_count("0x1") == 1
+
+
 def test_ankr_client_context_manager():
     """Test AnkrClient context manager."""
     with AnkrClient() as client:
         assert client.rpc_url is not None
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [
+        TokenHolder(address="0x1", balance="1", balance_raw="1"),
+        TokenMetadata(contract="0x1", blockchain="bsc", name="Test Token", symbol="TEST", decimals=18),
+    ],
+    ids=["TokenHolder", "TokenMetadata"],
+)
+def test_models_have_no_instance_dict(instance):
+    """Test per-row models use slots instead of a per-instance __dict__."""
+    assert not hasattr(instance, "__dict__")
+
+
+def test_shared_client_is_reused_until_closed():
+    """Test get_shared_client returns one client per process until closed."""
+    client = get_shared_client()
+    assert get_shared_client() is client
+
+    close_shared_client()
+    assert get_shared_client() is not client
+    close_shared_client()
@@ -4,168 +4,285 @@ Tests for AnkrClient API methods with mocked RPC responses.
 These tests verify API method logic without making real network requests.
 """
 
-from unittest.mock import MagicMock, patch
+import json
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import httpx
 import pytest
 
 from onchain_monitor.ankr_client import (
     AnkrClient,
+    AsyncAnkrClient,
     TokenHolder,
     TokenMetadata,
+    _cache_path,
+    _read_cache,
+    annotate_labels,
     get_holder_label,
 )
 
+# Canned Ankr results. The fake endpoint serializes them per call, so tests cannot mutate them.
+_RESP_COUNT_OK = {"holderCount": 12500}
+_RESP_COUNT_MISSING = {}
+_RESP_HOLDERS = {
+    "holders": [
+        {"holderAddress": "0xHolder1", "balance": "1000.5", "balanceRawInteger": "1000500000000000000000"},
+        {"holderAddress": "0xHolder2", "balance": "500.25", "balanceRawInteger": "500250000000000000000"},
+    ],
+    "nextPageToken": "page2token",
+}
+_RESP_HOLDERS_EMPTY = {"holders": [], "nextPageToken": None}
+_RESP_HOLDERS_BURN = {
+    "holders": [
+        {
+            "holderAddress": "0x000000000000000000000000000000000000dEaD",
+            "balance": "1000.5",
+            "balanceRawInteger": "1000500000000000000000",
+        },
+    ],
+}
+_RESP_HOLDERS_BURN_ADDRESS_ONLY = {"holders": [{"holderAddress": "0x000000000000000000000000000000000000dEaD"}]}
+_RESP_HOLDER_PAGES = {
+    None: {"holders": [{"holderAddress": "0xHolder1"}, {"holderAddress": "0xHolder2"}], "nextPageToken": "page2token"},
+    "page2token": {"holders": [{"holderAddress": "0xHolder3"}], "nextPageToken": None},
+}
+_RESP_PRICE = {"usdPrice": 0.0025}
+_RESP_ACCOUNT_BALANCE = {
+    "assets": [
+        {"tokenSymbol": "BNB", "balance": "1.5"},
+        {"tokenSymbol": "USDT", "balance": "100.0"},
+    ]
+}
+_RESP_TRANSFERS = {
+    "transfers": [
+        {"from": "0xSender", "to": "0xE8c3e6559513eEbAc3e05fd75c19a17F4A51A892", "value": "100"},
+        {"from": "0xE8c3e6559513eEbAc3e05fd75c19a17F4A51A892", "to": "0xReceiver", "value": "50"},
+    ]
+}
+_RESP_CURRENCIES = {
+    "currencies": [
+        {
+            "address": "0x000Ae314E2A2172a039B26378814C252734f556A",
+            "name": "Test Token",
+            "symbol": "TEST",
+            "decimals": 18,
+        }
+    ]
+}
+_RESP_CURRENCIES_EMPTY = {"currencies": []}
 
-class TestGetHolderLabel:
-    """Tests for get_holder_label function."""
 
-    def test_known_burn_address(self):
-        """Test that burn address returns correct label."""
-        result = get_holder_label("0x000000000000000000000000000000000000dEaD")
-        assert result == "Burn Address"
+def _fake_response(content):
+    """Build a minimal stand-in for httpx.Response with just what _call reads."""
+    return SimpleNamespace(content=content, raise_for_status=lambda: None)
 
-    def test_unknown_address(self):
-        """Test that unknown address returns empty string."""
-        result = get_holder_label("0x1234567890abcdef1234567890abcdef12345678")
-        assert result == ""
 
+class _FakeClient:
+    """Minimal stand-in for httpx.Client that returns a canned response and records posts."""
 
-class TestAnkrClientGetTokenHoldersCount:
-    """Tests for get_token_holders_count method."""
+    def __init__(self, response=None, error=None):
+        self._response = response
+        self._error = error
+        self.posts = []
 
-    def test_get_token_holders_count_mocked(self, mock_contract):
-        """Test get_token_holders_count with mocked response."""
-        mock_rpc_response = {"holderCount": 12500}
+    def post(self, url, **kwargs):
+        self.posts.append(kwargs)
+        if self._error is not None:
+            raise self._error
+        return self._response
 
-        with patch.object(AnkrClient, "_call", return_value=mock_rpc_response):
-            client = AnkrClient()
-            result = client.get_token_holders_count(mock_contract, blockchain="bsc")
 
-            assert result == 12500
-            client.close()
+@pytest.fixture
+def rpc_result(request, fake_rpc):
+    """
+    Answer every call on the fake Ankr endpoint with the indirectly parametrized result.
 
-    def test_get_token_holders_count_zero(self, mock_contract):
-        """Test get_token_holders_count returns 0 when no holders."""
-        mock_rpc_response = {}
+    An exception instance as the parameter is answered as a JSON-RPC error.
+    """
+    fake_rpc.default = getattr(request, "param", None)
+    return fake_rpc.default
 
-        with patch.object(AnkrClient, "_call", return_value=mock_rpc_response):
-            client = AnkrClient()
-            result = client.get_token_holders_count(mock_contract)
 
-            assert result == 0
-            client.close()
+class TestGetHolderLabel:
+    """Tests for get_holder_label function."""
+
+    @pytest.mark.parametrize(
+        "address, expected",
+        [
+            ("0x000000000000000000000000000000000000dEaD", "Burn Address"),
+            ("0xF977814E90DA44BFA03B6295A0616A897441ACEC", "Binance Hot Wallet"),
+            ("0x1234567890abcdef1234567890abcdef12345678", ""),
+        ],
+        ids=["burn", "case-insensitive", "unknown"],
+    )
+    def test_get_holder_label(self, address, expected):
+        """Test known addresses map to labels in any casing, unknown ones to an empty string."""
+        assert get_holder_label(address) == expected
+
+
+@pytest.mark.usefixtures("rpc_result")
+class TestAnkrClientGetTokenHoldersCount:
+    """Tests for get_token_holders_count method."""
+
+    @pytest.mark.parametrize(
+        "rpc_result, expected",
+        [(_RESP_COUNT_OK, 12500), (_RESP_COUNT_MISSING, 0)],
+        indirect=["rpc_result"],
+        ids=["count", "missing"],
+    )
+    def test_get_token_holders_count(self, ankr_client, mock_contract, expected):
+        """Test get_token_holders_count reads holderCount, defaulting to 0."""
+        assert ankr_client.get_token_holders_count(mock_contract, blockchain="bsc") == expected
 
 
+@pytest.mark.usefixtures("rpc_result")
 class TestAnkrClientGetTokenHolders:
     """Tests for get_token_holders method."""
 
-    def test_get_token_holders_mocked(self, mock_contract):
-        """Test get_token_holders with mocked response."""
-        mock_rpc_response = {
-            "holders": [
-                {
-                    "holderAddress": "0xHolder1",
-                    "balance": "1000.5",
-                    "balanceRawInteger": "1000500000000000000000",
-                },
-                {
-                    "holderAddress": "0xHolder2",
-                    "balance": "500.25",
-                    "balanceRawInteger": "500250000000000000000",
-                },
-            ],
-            "nextPageToken": "page2token",
+    @pytest.mark.parametrize(
+        "rpc_result, expected, expected_token",
+        [
+            (_RESP_HOLDERS, [("0xHolder1", "1000.5"), ("0xHolder2", "500.25")], "page2token"),
+            (_RESP_HOLDERS_EMPTY, [], None),
+        ],
+        indirect=["rpc_result"],
+        ids=["populated", "empty"],
+    )
+    def test_get_token_holders(self, ankr_client, mock_contract, expected, expected_token):
+        """Test get_token_holders parses each page and its next token."""
+        holders, next_token = ankr_client.get_token_holders(mock_contract)
+
+        assert all(isinstance(h, TokenHolder) for h in holders)
+        assert [(h.address, h.balance) for h in holders] == expected
+        assert next_token == expected_token
+
+    @pytest.mark.parametrize("rpc_result", [_RESP_HOLDERS_BURN], indirect=True)
+    def test_get_token_holders_raw_uses_snapshot_keys(self, ankr_client, mock_contract):
+        """Test get_token_holders_raw returns dicts keyed for snapshots."""
+        holders, next_token = ankr_client.get_token_holders_raw(mock_contract)
+
+        assert holders == [
+            {
+                "address": "0x000000000000000000000000000000000000dEaD",
+                "balance": "1000.5",
+                "balance_raw": "1000500000000000000000",
+                "label": "Burn Address",
+            }
+        ]
+        assert next_token is None
+
+    @pytest.mark.parametrize("rpc_result", [_RESP_HOLDERS_BURN_ADDRESS_ONLY], indirect=True)
+    def test_get_token_holders_deferred_labels(self, ankr_client, mock_contract):
+        """Test labels can be skipped on fetch and filled in with annotate_labels."""
+        holders, _ = ankr_client.get_token_holders(mock_contract, resolve_labels=False)
+
+        assert holders[0].label == ""
+        assert annotate_labels(holders)[0].label == "Burn Address"
+
+
+class TestAnkrClientGetAllHolders:
+    """Tests for get_all_holders pagination."""
+
+    def test_get_all_holders_collects_every_page(self, ankr_client, fake_rpc, mock_contract):
+        """Test pages are concatenated and progress is reported after each one."""
+        fake_rpc.results["ankr_getTokenHolders"] = lambda params: _RESP_HOLDER_PAGES[params.get("pageToken")]
+        counts = []
+
+        holders = ankr_client.get_all_holders(mock_contract, progress_callback=counts.append)
+
+        assert [h.address for h in holders] == ["0xHolder1", "0xHolder2", "0xHolder3"]
+        assert counts == [2, 3]
+
+    def test_iter_all_holders_prefetches_next_page(self, ankr_client, fake_rpc, mock_contract):
+        """Test the next page is requested before the current one is consumed."""
+        pages = {
+            None: {"holders": [{"holderAddress": "0xHolder1"}], "nextPageToken": "page2token"},
+            "page2token": {"holders": [{"holderAddress": "0xHolder2"}], "nextPageToken": None},
         }
+        second_requested = threading.Event()
 
-        with patch.object(AnkrClient, "_call", return_value=mock_rpc_response):
-            client = AnkrClient()
-            holders, next_token = client.get_token_holders(mock_contract)
+        def answer(params):
+            if params.get("pageToken") == "page2token":
+                second_requested.set()
+            return pages[params.get("pageToken")]
 
-            assert len(holders) == 2
-            assert isinstance(holders[0], TokenHolder)
-            assert holders[0].address == "0xHolder1"
-            assert holders[0].balance == "1000.5"
-            assert next_token == "page2token"
-            client.close()
+        fake_rpc.results["ankr_getTokenHolders"] = answer
+        page_iter = ankr_client.iter_all_holders(mock_contract)
 
-    def test_get_token_holders_empty(self, mock_contract):
-        """Test get_token_holders returns empty list when no holders."""
-        mock_rpc_response = {"holders": [], "nextPageToken": None}
+        first = next(page_iter)
+        assert second_requested.wait(timeout=5)
+        second = next(page_iter)
 
-        with patch.object(AnkrClient, "_call", return_value=mock_rpc_response):
-            client = AnkrClient()
-            holders, next_token = client.get_token_holders(mock_contract)
+        assert [h.address for h in first + second] == ["0xHolder1", "0xHolder2"]
+        assert list(page_iter) == []
 
-            assert len(holders) == 0
-            assert next_token is None
-            client.close()
+    def test_client_is_safe_to_share_with_prefetch_thread(self, fake_rpc):
+        """Test concurrent calls get unique request ids and share one HTTP client."""
+        client = AnkrClient(transport=httpx.MockTransport(fake_rpc))
+        http_clients = []
+
+        def worker():
+            http_clients.append(client._get_client())
+            for _ in range(50):
+                client._call("ankr_getTokenPrice", {})
 
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        client.close()
 
+        ids = [call["id"] for call in fake_rpc.calls]
+        assert len(ids) == len(set(ids)) == 400
+        assert all(http_client is http_clients[0] for http_client in http_clients)
+
+
+@pytest.mark.usefixtures("rpc_result")
 class TestAnkrClientGetTokenPrice:
     """Tests for get_token_price method."""
 
-    def test_get_token_price_mocked(self, mock_contract):
+    @pytest.mark.parametrize("rpc_result", [_RESP_PRICE], indirect=True)
+    def test_get_token_price_mocked(self, ankr_client, mock_contract):
         """Test get_token_price with mocked response."""
-        mock_rpc_response = {"usdPrice": 0.0025}
-
-        with patch.object(AnkrClient, "_call", return_value=mock_rpc_response):
-            client = AnkrClient()
-            result = client.get_token_price(mock_contract)
+        result = ankr_client.get_token_price(mock_contract)
 
-            assert result == 0.0025
-            client.close()
+        assert result == 0.0025
 
-    def test_get_token_price_error_returns_none(self, mock_contract):
+    @pytest.mark.parametrize("rpc_result", [Exception("RPC Error")], indirect=True)
+    def test_get_token_price_error_returns_none(self, ankr_client, mock_contract):
         """Test get_token_price returns None on error."""
-        with patch.object(AnkrClient, "_call", side_effect=Exception("RPC Error")):
-            client = AnkrClient()
-            result = client.get_token_price(mock_contract)
+        result = ankr_client.get_token_price(mock_contract)
 
-            assert result is None
-            client.close()
+        assert result is None
 
 
+@pytest.mark.usefixtures("rpc_result")
 class TestAnkrClientGetAccountBalance:
     """Tests for get_account_balance method."""
 
-    def test_get_account_balance_mocked(self, mock_wallet):
+    @pytest.mark.parametrize("rpc_result", [_RESP_ACCOUNT_BALANCE], indirect=True)
+    def test_get_account_balance_mocked(self, ankr_client, mock_wallet):
         """Test get_account_balance with mocked response."""
-        mock_rpc_response = {
-            "assets": [
-                {"tokenSymbol": "BNB", "balance": "1.5"},
-                {"tokenSymbol": "USDT", "balance": "100.0"},
-            ]
-        }
+        result = ankr_client.get_account_balance(mock_wallet)
 
-        with patch.object(AnkrClient, "_call", return_value=mock_rpc_response):
-            client = AnkrClient()
-            result = client.get_account_balance(mock_wallet)
-
-            assert len(result) == 2
-            assert result[0]["tokenSymbol"] == "BNB"
-            client.close()
+        assert len(result) == 2
+        assert result[0]["tokenSymbol"] == "BNB"
 
 
+@pytest.mark.usefixtures("rpc_result")
 class TestAnkrClientGetTokenTransfers:
     """Tests for get_token_transfers method."""
 
-    def test_get_token_transfers_mocked(self, mock_wallet):
+    @pytest.mark.parametrize("rpc_result", [_RESP_TRANSFERS], indirect=True)
+    def test_get_token_transfers_mocked(self, ankr_client, mock_wallet):
         """Test get_token_transfers with mocked response."""
-        mock_rpc_response = {
-            "transfers": [
-                {"from": "0xSender", "to": mock_wallet, "value": "100"},
-                {"from": mock_wallet, "to": "0xReceiver", "value": "50"},
-            ]
-        }
+        result = ankr_client.get_token_transfers(mock_wallet)
 
-        with patch.object(AnkrClient, "_call", return_value=mock_rpc_response):
-            client = AnkrClient()
-            result = client.get_token_transfers(mock_wallet)
-
-            assert len(result) == 2
-            assert result[0]["from"] == "0xSender"
-            client.close()
+        assert len(result) == 2
+        assert result[0]["from"] == "0xSender"
 
 
 class TestAnkrClientCallMethod:
@@ -173,69 +290,274 @@ class TestAnkrClientCallMethod:
 
     def test_call_rpc_error_raises_exception(self):
         """Test that RPC errors raise ValueError."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"error": {"message": "Invalid request"}}
-        mock_response.raise_for_status = MagicMock()
-
-        with patch.object(AnkrClient, "_get_client") as mock_get_client:
-            mock_client = MagicMock()
-            mock_client.post.return_value = mock_response
-            mock_get_client.return_value = mock_client
+        response = _fake_response(b'{"error": {"message": "Invalid request"}}')
 
+        with patch.object(AnkrClient, "_get_client", return_value=_FakeClient(response)):
             client = AnkrClient()
             with pytest.raises(ValueError, match="Ankr API error"):
                 client._call("test_method", {})
             client.close()
 
+    def test_call_sends_json_rpc_request(self):
+        """Test that the prebuilt request body is valid JSON-RPC."""
+        fake_client = _FakeClient(_fake_response(b'{"jsonrpc": "2.0", "id": 1, "result": {"holderCount": 3}}'))
+
+        with patch.object(AnkrClient, "_get_client", return_value=fake_client):
+            client = AnkrClient()
+            params = {"blockchain": "bsc", "pageToken": 'a"b\\c'}
+            assert client._call("ankr_getTokenHoldersCount", params) == {"holderCount": 3}
+
+            payload = json.loads(fake_client.posts[-1]["content"])
+            assert payload == {"id": 1, "jsonrpc": "2.0", "method": "ankr_getTokenHoldersCount", "params": params}
+            client.close()
+
     def test_call_http_error(self):
         """Test that HTTP errors are raised."""
-        with patch.object(AnkrClient, "_get_client") as mock_get_client:
-            mock_client = MagicMock()
-            mock_client.post.side_effect = httpx.HTTPStatusError(
-                "Server Error", request=MagicMock(), response=MagicMock()
-            )
-            mock_get_client.return_value = mock_client
+        request = httpx.Request("POST", "https://rpc.ankr.com/multichain")
+        error = httpx.HTTPStatusError("Server Error", request=request, response=httpx.Response(500, request=request))
 
+        with patch.object(AnkrClient, "_get_client", return_value=_FakeClient(error=error)):
             client = AnkrClient()
             with pytest.raises(httpx.HTTPStatusError):
                 client._call("test_method", {})
             client.close()
 
 
-class TestAnkrClientGetTokenMetadata:
-    """Tests for get_token_metadata method."""
+class TestAnkrClientBatchCall:
+    """Tests for batch_call RPC method."""
 
-    def test_get_token_metadata_found(self, mock_contract):
-        """Test get_token_metadata when token is found."""
-        mock_rpc_response = {
-            "currencies": [
-                {
-                    "address": mock_contract,
-                    "name": "Test Token",
-                    "symbol": "TEST",
-                    "decimals": 18,
-                }
-            ]
-        }
+    def test_batch_call_orders_results_by_id(self):
+        """Test that batch results are matched to calls by id."""
+        fake_client = _FakeClient(_fake_response(json.dumps([
+            {"id": 2, "jsonrpc": "2.0", "result": {"usdPrice": 0.5}},
+            {"id": 1, "jsonrpc": "2.0", "result": {"holderCount": 10}},
+        ])))
 
-        with patch.object(AnkrClient, "_call", return_value=mock_rpc_response):
+        with patch.object(AnkrClient, "_get_client", return_value=fake_client):
             client = AnkrClient()
-            result = client.get_token_metadata(mock_contract)
+            results = client.batch_call([
+                ("ankr_getTokenHoldersCount", {}),
+                ("ankr_getTokenPrice", {}),
+            ])
+
+            assert results == [{"holderCount": 10}, {"usdPrice": 0.5}]
+            payload = json.loads(fake_client.posts[-1]["content"])
+            assert [p["method"] for p in payload] == ["ankr_getTokenHoldersCount", "ankr_getTokenPrice"]
+            client.close()
 
-            assert result is not None
-            assert isinstance(result, TokenMetadata)
-            assert result.name == "Test Token"
-            assert result.symbol == "TEST"
+    def test_batch_call_item_error_does_not_break_batch(self, mock_contract):
+        """Test that a failing call yields an error while others succeed."""
+        response = _fake_response(json.dumps([
+            {"id": 1, "jsonrpc": "2.0", "error": {"message": "Price unavailable"}},
+            {"id": 2, "jsonrpc": "2.0", "result": {"holderCount": 42}},
+        ]))
+
+        with patch.object(AnkrClient, "_get_client", return_value=_FakeClient(response)):
+            client = AnkrClient()
+            price_result, count_result = client.batch_call([
+                ("ankr_getTokenPrice", {}),
+                ("ankr_getTokenHoldersCount", {}),
+            ])
+
+            assert isinstance(price_result, ValueError)
+            assert client.get_token_price(mock_contract, prefetched=price_result) is None
+            assert client.get_token_holders_count(mock_contract, prefetched=count_result) == 42
             client.close()
 
-    def test_get_token_metadata_not_found(self, mock_contract):
-        """Test get_token_metadata returns None when token not found."""
-        mock_rpc_response = {"currencies": []}
+    @pytest.mark.parametrize("cached", [False, True], ids=["currencies-fetched", "currencies-cached"])
+    def test_prefetch_token_info_batches_calls(self, ankr_client, fake_rpc, mock_contract, cached):
+        """Test prefetch_token_info names each result and skips cached currencies."""
+        fake_rpc.results.update(ankr_getTokenPrice=_RESP_PRICE, ankr_getTokenHoldersCount=_RESP_COUNT_OK)
+        if cached:
+            ankr_client.get_token_metadata(mock_contract)
+            fake_rpc.calls.clear()
+
+        prefetched = ankr_client.prefetch_token_info(mock_contract, holder_count=True)
+
+        assert prefetched["price"] == _RESP_PRICE
+        assert prefetched["holder_count"] == _RESP_COUNT_OK
+        assert prefetched["holders"] is None
+        assert (prefetched["currencies"] is None) == cached
+        expected = ["ankr_getTokenPrice", "ankr_getTokenHoldersCount"] + ([] if cached else ["ankr_getCurrencies"])
+        assert fake_rpc.methods() == expected
+
+    def test_prefetch_token_info_falls_back_when_batch_rejected(self, ankr_client, fake_rpc, mock_contract):
+        """Test a batch rejected as a whole leaves every call to its get_* method."""
+        fake_rpc.reject_batches = True
+        fake_rpc.results.update(ankr_getTokenPrice=_RESP_PRICE, ankr_getTokenHoldersCount=_RESP_COUNT_OK)
 
-        with patch.object(AnkrClient, "_call", return_value=mock_rpc_response):
+        prefetched = ankr_client.prefetch_token_info(mock_contract, holder_count=True)
+
+        assert set(prefetched.values()) == {None}
+        assert ankr_client.get_token_price(mock_contract, prefetched=prefetched["price"]) == 0.0025
+        assert ankr_client.get_token_holders_count(mock_contract, prefetched=prefetched["holder_count"]) == 12500
+
+    def test_prefetch_token_info_falls_back_on_http_error(self, mock_contract):
+        """Test an endpoint answering array payloads with an HTTP error is not fatal."""
+        def handler(request):
+            if request.content.startswith(b"["):
+                return httpx.Response(400)
+            return httpx.Response(200, json={"jsonrpc": "2.0", "id": 1, "result": _RESP_COUNT_OK})
+
+        with AnkrClient(transport=httpx.MockTransport(handler)) as client:
+            prefetched = client.prefetch_token_info(mock_contract, holder_count=True)
+
+            assert prefetched["holder_count"] is None
+            assert client.get_token_holders_count(mock_contract, prefetched=prefetched["holder_count"]) == 12500
+
+
+class TestAnkrClientDiskCache:
+    """Tests for the on-disk cache behind _call."""
+
+    def test_call_served_from_cache_within_ttl(self):
+        """Test a cached result is reused and an uncached call still posts."""
+        fake_client = _FakeClient(_fake_response(b'{"result": {"usdPrice": 1.5}}'))
+
+        with patch.object(AnkrClient, "_get_client", return_value=fake_client):
             client = AnkrClient()
-            result = client.get_token_metadata(mock_contract)
+            first = client._call("ankr_getTokenPrice", {"contractAddress": "0x1"}, cache_ttl=60)
+            second = client._call("ankr_getTokenPrice", {"contractAddress": "0x1"}, cache_ttl=60)
+            client._call("ankr_getTokenPrice", {"contractAddress": "0x1"})
 
-            assert result is None
+            assert first == second == {"usdPrice": 1.5}
+            assert len(fake_client.posts) == 2
+            client.close()
+
+    @pytest.mark.parametrize("entry", [b"[]", b'"stale"', b'{"data": 1}', b'{"cached_at": "now", "data": 1}'])
+    def test_malformed_cache_entry_is_a_miss(self, entry):
+        """Test a cache file that is valid JSON but not a cache entry is ignored."""
+        params = {"contractAddress": "0x1"}
+        path = _cache_path("ankr_getTokenPrice", params)
+        path.parent.mkdir(parents=True)
+        path.write_bytes(entry)
+        fake_client = _FakeClient(_fake_response(b'{"result": {"usdPrice": 1.5}}'))
+
+        with patch.object(AnkrClient, "_get_client", return_value=fake_client):
+            client = AnkrClient()
+            result = client._call("ankr_getTokenPrice", params, cache_ttl=60)
+
+            assert result == {"usdPrice": 1.5}
+            assert len(fake_client.posts) == 1
             client.close()
+
+    def test_expired_cache_entry_is_deleted(self):
+        """Test a miss on a stale entry removes its file."""
+        path = _cache_path("ankr_getTokenPrice", {"contractAddress": "0x1"})
+        path.parent.mkdir(parents=True)
+        path.write_bytes(json.dumps({"cached_at": 0, "data": {"usdPrice": 1.5}}).encode())
+
+        assert _read_cache(path, 60) is None
+        assert not path.exists()
+
+    def test_prefetched_result_is_written_through(self, ankr_client, fake_rpc, mock_contract):
+        """Test a batched price is cached on disk like a direct call would be."""
+        fake_rpc.results["ankr_getTokenPrice"] = _RESP_PRICE
+        prefetched = ankr_client.prefetch_token_info(mock_contract)
+        ankr_client.get_token_price(mock_contract, prefetched=prefetched["price"])
+        fake_rpc.calls.clear()
+
+        with AnkrClient(transport=httpx.MockTransport(fake_rpc)) as client:
+            assert client.get_token_price(mock_contract) == 0.0025
+        assert fake_rpc.calls == []
+
+
+@pytest.mark.usefixtures("rpc_result")
+class TestAnkrClientGetTokenMetadata:
+    """Tests for get_token_metadata method."""
+
+    @pytest.mark.parametrize(
+        "rpc_result, expected",
+        [(_RESP_CURRENCIES, ("Test Token", "TEST", 18)), (_RESP_CURRENCIES_EMPTY, None)],
+        indirect=["rpc_result"],
+        ids=["found", "not-found"],
+    )
+    def test_get_token_metadata(self, ankr_client, mock_contract, expected):
+        """Test get_token_metadata returns TokenMetadata, or None when the token is unknown."""
+        result = ankr_client.get_token_metadata(mock_contract)
+
+        if expected is None:
+            assert result is None
+        else:
+            assert isinstance(result, TokenMetadata)
+            assert (result.name, result.symbol, result.decimals) == expected
+
+
+class TestAsyncAnkrClient:
+    """Tests for AsyncAnkrClient methods."""
+
+    async def test_get_token_holders_count_mocked(self, fake_rpc, mock_contract):
+        """Test async get_token_holders_count against the fake endpoint."""
+        fake_rpc.results["ankr_getTokenHoldersCount"] = {"holderCount": 12500}
+
+        async with AsyncAnkrClient(transport=httpx.MockTransport(fake_rpc)) as client:
+            result = await client.get_token_holders_count(mock_contract)
+
+        assert result == 12500
+
+    async def test_get_all_holders_follows_page_tokens(self, fake_rpc, mock_contract):
+        """Test async get_all_holders requests pages until no token is returned."""
+        pages = {
+            None: {"holders": [{"holderAddress": "0xHolder1", "balance": "2"}], "nextPageToken": "page2token"},
+            "page2token": {"holders": [{"holderAddress": "0xHolder2", "balance": "1"}], "nextPageToken": None},
+        }
+        fake_rpc.results["ankr_getTokenHolders"] = lambda params: pages[params.get("pageToken")]
+
+        async with AsyncAnkrClient(transport=httpx.MockTransport(fake_rpc)) as client:
+            holders = await client.get_all_holders(mock_contract)
+
+        assert [h.address for h in holders] == ["0xHolder1", "0xHolder2"]
+        assert [call["params"].get("pageToken") for call in fake_rpc.calls] == [None, "page2token"]
+
+    async def test_get_token_metadata_indexes_currencies_once(self, fake_rpc, mock_contract):
+        """Test async metadata lookups are case-insensitive and reuse the index."""
+        fake_rpc.results["ankr_getCurrencies"] = {
+            "currencies": [{"address": mock_contract.lower(), "name": "Test Token", "symbol": "TEST"}]
+        }
+
+        async with AsyncAnkrClient(transport=httpx.MockTransport(fake_rpc)) as client:
+            first = await client.get_token_metadata(mock_contract)
+            second = await client.get_token_metadata(mock_contract.upper())
+
+        assert first.symbol == second.symbol == "TEST"
+        assert fake_rpc.methods() == ["ankr_getCurrencies"]
+
+    async def test_get_token_price_error_returns_none(self, fake_rpc, mock_contract):
+        """Test async get_token_price returns None on error."""
+        fake_rpc.results["ankr_getTokenPrice"] = ValueError("RPC Error")
+
+        async with AsyncAnkrClient(transport=httpx.MockTransport(fake_rpc)) as client:
+            result = await client.get_token_price(mock_contract)
+
+        assert result is None
+
+
+class TestAnkrClientCurrenciesCache:
+    """Tests for the currencies cache behind get_token_metadata."""
+
+    def test_currencies_fetched_once_per_client(self, ankr_client, fake_rpc, mock_contract):
+        """Test repeated metadata lookups reuse the cached currency list."""
+        fake_rpc.results["ankr_getCurrencies"] = {
+            "currencies": [{"address": mock_contract.lower(), "name": "Test Token", "symbol": "TEST"}]
+        }
+
+        first = ankr_client.get_token_metadata(mock_contract)
+        second = ankr_client.get_token_metadata(mock_contract)
+
+        assert first == second
+        assert first.name == "Test Token"
+        assert fake_rpc.methods() == ["ankr_getCurrencies"]
+
+    def test_currencies_disk_cache_shared_across_clients(self, ankr_client, fake_rpc, mock_contract, isolated_cache_dir):
+        """Test a fresh on-disk currencies cache is used by a new client."""
+        fake_rpc.results["ankr_getCurrencies"] = {
+            "currencies": [{"address": mock_contract, "name": "Test Token", "symbol": "TEST"}]
+        }
+        ankr_client.get_token_metadata(mock_contract)
+
+        assert list(isolated_cache_dir.glob("ankr_getCurrencies_*.json"))
+
+        fake_rpc.reset()
+        with AnkrClient(transport=httpx.MockTransport(fake_rpc)) as client:
+            assert client.is_currencies_cached("bsc")
+            assert client.get_token_metadata(mock_contract).symbol == "TEST"
+        assert fake_rpc.calls == []
@@ -2,28 +2,22 @@
 Tests for the config module.
 """
 
-from onchain_monitor import config
-
-
-def test_supported_chains_exist():
-    """Test that supported chains are defined."""
-    assert hasattr(config, "SUPPORTED_CHAINS")
-    assert len(config.SUPPORTED_CHAINS) > 0
-    assert "bsc" in config.SUPPORTED_CHAINS
-    assert "eth" in config.SUPPORTED_CHAINS
-
+import pytest
 
-def test_ankr_rpc_url():
-    """Test that Ankr RPC URL is defined."""
-    assert hasattr(config, "ANKR_RPC_URL")
-    assert "ankr.com" in config.ANKR_RPC_URL
-
-
-def test_snapshot_dir():
-    """Test that snapshot directory is defined."""
-    assert hasattr(config, "SNAPSHOT_DIR")
+from onchain_monitor import config
 
 
-def test_request_timeout_positive():
-    """Test that request timeout is positive."""
-    assert config.REQUEST_TIMEOUT > 0
+@pytest.mark.parametrize(
+    "attr, check",
+    [
+        ("SUPPORTED_CHAINS", lambda chains: len(chains) > 0 and "bsc" in chains and "eth" in chains),
+        ("ANKR_RPC_URL", lambda url: "ankr.com" in url),
+        ("SNAPSHOT_DIR", lambda path: path is not None),
+        ("REQUEST_TIMEOUT", lambda timeout: timeout > 0),
+    ],
+    ids=["SUPPORTED_CHAINS", "ANKR_RPC_URL", "SNAPSHOT_DIR", "REQUEST_TIMEOUT"],
+)
+def test_config_shape(attr, check):
+    """Test that each required setting is defined with a sane value."""
+    assert hasattr(config, attr)
+    assert check(getattr(config, attr))
@@ -0,0 +1,51 @@
+"""
+Tests for the CLI commands.
+"""
+
+import pytest
+
+from onchain_monitor.main import cmd_basic
+
+_CURRENCIES = {"currencies": [{"address": "0xToken", "name": "Test Token", "symbol": "TEST", "decimals": 18}]}
+_HOLDERS = {"holders": [{"holderAddress": "0x000000000000000000000000000000000000dEaD", "balance": "1000"}]}
+
+
+@pytest.fixture
+def cli_client(ankr_client, fake_rpc, monkeypatch):
+    """Point the CLI's shared client at the fake endpoint."""
+    monkeypatch.setattr("onchain_monitor.main.get_shared_client", lambda: ankr_client)
+    fake_rpc.results.update(
+        ankr_getCurrencies=_CURRENCIES,
+        ankr_getTokenPrice={"usdPrice": 0.5},
+        ankr_getTokenHolders=_HOLDERS,
+    )
+    return ankr_client
+
+
+@pytest.mark.parametrize("cached", [False, True], ids=["currencies-fetched", "currencies-cached"])
+def test_cmd_basic_prints_token_info(cli_client, fake_rpc, capsys, cached):
+    """Test cmd_basic batches its lookups and only fetches currencies when not cached."""
+    if cached:
+        cli_client.get_token_metadata("0xToken")
+        fake_rpc.calls.clear()
+
+    cmd_basic("0xToken")
+
+    out = capsys.readouterr().out
+    assert "Symbol: TEST" in out
+    assert "Price: $0.500000" in out
+    assert "(Burn Address)" in out
+    expected = ["ankr_getTokenPrice", "ankr_getTokenHolders"] + ([] if cached else ["ankr_getCurrencies"])
+    assert fake_rpc.methods() == expected
+
+
+def test_cmd_basic_survives_rejected_batch(cli_client, fake_rpc, capsys):
+    """Test cmd_basic falls back to individual calls when batches are not supported."""
+    fake_rpc.reject_batches = True
+
+    cmd_basic("0xToken")
+
+    out = capsys.readouterr().out
+    assert "Symbol: TEST" in out
+    assert "Price: $0.500000" in out
+    assert fake_rpc.methods() == ["ankr_getCurrencies", "ankr_getTokenPrice", "ankr_getTokenHolders"]
@@ -0,0 +1,189 @@
+"""
+Tests for the snapshot module.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from onchain_monitor.ankr_client import AsyncAnkrClient
+from onchain_monitor.snapshot import (
+    SnapshotWriter,
+    compare_snapshots,
+    create_holders_snapshot,
+    create_holders_snapshot_async,
+    load_snapshot,
+    save_snapshot,
+)
+
+
+def test_snapshot_writer_roundtrip(tmp_path):
+    """Test that a streamed snapshot loads back as one JSON document."""
+    header = {"contract": "0xToken", "blockchain": "bsc", "price_usd": 1.5}
+    pages = [
+        [{"address": "0xHolder1", "balance": "2", "balance_raw": "2000", "label": ""}],
+        [{"address": "0xHolder2", "balance": "1", "balance_raw": "1000", "label": ""}],
+    ]
+
+    with SnapshotWriter(header, "holders_bsc", output_dir=tmp_path) as writer:
+        for page in pages:
+            writer.write_page(page)
+
+    snapshot = load_snapshot(writer.path)
+    assert snapshot["contract"] == "0xToken"
+    assert snapshot["holder_count"] == 2
+    assert [h["address"] for h in snapshot["holders"]] == ["0xHolder1", "0xHolder2"]
+
+
+@pytest.mark.parametrize("pretty, suffix", [(False, ".zst"), (True, ".json")])
+def test_snapshot_writer_formats(tmp_path, pretty, suffix):
+    """Test compressed and pretty snapshots both load back identically."""
+    holders = [{"address": "0xHolder1", "balance": "1", "balance_raw": "1000", "label": ""}]
+
+    with SnapshotWriter({"contract": "0xToken"}, "holders_bsc", output_dir=tmp_path, pretty=pretty) as writer:
+        writer.write_page(holders)
+
+    assert writer.path.suffix == suffix
+    assert load_snapshot(writer.path) == {"contract": "0xToken", "holders": holders, "holder_count": 1}
+
+
+def test_save_snapshot_roundtrip(tmp_path):
+    """Test save_snapshot writes a compressed file load_snapshot can read."""
+    data = {"contract": "0xToken", "holders": []}
+
+    path = save_snapshot(data, "holders_bsc", output_dir=tmp_path)
+
+    assert path.name.endswith(".json.zst")
+    assert load_snapshot(path) == data
+
+
+def test_snapshot_writer_resolves_labels(tmp_path):
+    """Test that the writer fills in known labels when asked to."""
+    holders = [{"address": "0x000000000000000000000000000000000000DEAD", "balance": "1", "label": ""}]
+
+    with SnapshotWriter({"contract": "0xToken"}, "holders_bsc", output_dir=tmp_path, resolve_labels=True) as writer:
+        writer.write_page(holders)
+
+    assert load_snapshot(writer.path)["holders"][0]["label"] == "Burn Address"
+
+
+def test_snapshot_writer_discards_partial_file_on_error(tmp_path):
+    """Test that a failed snapshot leaves no file behind."""
+    with pytest.raises(RuntimeError):
+        with SnapshotWriter({"contract": "0xToken"}, "holders_bsc", output_dir=tmp_path) as writer:
+            writer.write_page([{"address": "0xHolder1"}])
+            raise RuntimeError("pagination failed")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+async def test_async_snapshot_requests_first_page_with_header_calls(tmp_path, monkeypatch, fake_rpc):
+    """Test the first holders page is in flight before the header calls finish."""
+    monkeypatch.setattr("onchain_monitor.snapshot.SNAPSHOT_DIR", tmp_path)
+    fake_rpc.results["ankr_getTokenHoldersCount"] = {"holderCount": 1}
+    fake_rpc.results["ankr_getTokenHolders"] = {"holders": [{"holderAddress": "0xHolder1", "balance": "1"}]}
+    first_page_requested = asyncio.Event()
+
+    async def handler(request):
+        if b"ankr_getTokenHolders\"" in request.content:
+            first_page_requested.set()
+        elif b"ankr_getTokenHoldersCount" in request.content:
+            # Holds the header back until the holders page has gone out
+            await asyncio.wait_for(first_page_requested.wait(), timeout=5)
+        return fake_rpc(request)
+
+    async with AsyncAnkrClient(transport=httpx.MockTransport(handler)) as client:
+        summary = await create_holders_snapshot_async("0xToken", client=client)
+
+    assert summary["holder_count"] == 1
+    assert [p.name for p in tmp_path.glob("*.json.zst")]
+
+
+@pytest.mark.parametrize("cached", [False, True], ids=["currencies-fetched", "currencies-cached"])
+def test_snapshot_bootstraps_in_one_batch(tmp_path, monkeypatch, ankr_client, fake_rpc, cached):
+    """Test the header lookups go out as one batch that skips cached currencies."""
+    monkeypatch.setattr("onchain_monitor.snapshot.SNAPSHOT_DIR", tmp_path)
+    fake_rpc.results.update(
+        ankr_getCurrencies={"currencies": [{"address": "0xToken", "name": "Test Token", "symbol": "TEST"}]},
+        ankr_getTokenPrice={"usdPrice": 0.5},
+        ankr_getTokenHoldersCount={"holderCount": 1},
+        ankr_getTokenHolders={"holders": [{"holderAddress": "0xHolder1", "balance": "1"}]},
+    )
+    if cached:
+        ankr_client.get_token_metadata("0xToken")
+        fake_rpc.calls.clear()
+
+    summary = create_holders_snapshot("0xToken", client=ankr_client)
+
+    assert (summary["token_symbol"], summary["price_usd"], summary["holder_count"]) == ("TEST", 0.5, 1)
+    batch = ["ankr_getTokenPrice", "ankr_getTokenHoldersCount"] + ([] if cached else ["ankr_getCurrencies"])
+    assert fake_rpc.methods() == batch + ["ankr_getTokenHolders"]
+
+
+def test_snapshot_streams_all_pages_to_disk(tmp_path, monkeypatch, ankr_client, fake_rpc):
+    """Test the sync snapshot writes every page, with labels, and leaves no part files."""
+    monkeypatch.setattr("onchain_monitor.snapshot.SNAPSHOT_DIR", tmp_path)
+    pages = {
+        None: {
+            "holders": [{"holderAddress": "0x000000000000000000000000000000000000dEaD", "balance": "5"}],
+            "nextPageToken": "page2token",
+        },
+        "page2token": {"holders": [{"holderAddress": "0xHolder2", "balance": "1"}], "nextPageToken": None},
+    }
+    fake_rpc.results.update(
+        ankr_getCurrencies={"currencies": [{"address": "0xToken", "name": "Test Token", "symbol": "TEST"}]},
+        ankr_getTokenPrice={"usdPrice": 0.5},
+        ankr_getTokenHoldersCount={"holderCount": 2},
+        ankr_getTokenHolders=lambda params: pages[params.get("pageToken")],
+    )
+    counts = []
+
+    summary = create_holders_snapshot("0xToken", client=ankr_client, progress_callback=counts.append)
+
+    assert summary["holder_count"] == 2
+    assert (summary["token_name"], summary["token_symbol"], summary["price_usd"]) == ("Test Token", "TEST", 0.5)
+    assert counts == [1, 2]
+
+    [path] = tmp_path.glob("holders_bsc_*.json.zst")
+    snapshot = load_snapshot(path)
+    assert snapshot == {**summary, "holders": snapshot["holders"]}
+    assert [(h["address"], h["label"]) for h in snapshot["holders"]] == [
+        ("0x000000000000000000000000000000000000dEaD", "Burn Address"),
+        ("0xHolder2", ""),
+    ]
+    assert not list(tmp_path.glob("*.part"))
+
+
+def test_snapshot_rerun_resumes_from_cached_pages(tmp_path, monkeypatch, ankr_client, fake_rpc):
+    """Test a rerun after a failed page only requests the pages it is missing."""
+    monkeypatch.setattr("onchain_monitor.snapshot.SNAPSHOT_DIR", tmp_path)
+    pages = {
+        None: {"holders": [{"holderAddress": "0xHolder1", "balance": "2"}], "nextPageToken": "page2token"},
+        "page2token": ValueError("rate limited"),
+    }
+    fake_rpc.results["ankr_getTokenHolders"] = lambda params: pages[params.get("pageToken")]
+
+    with pytest.raises(ValueError, match="rate limited"):
+        create_holders_snapshot("0xToken", client=ankr_client, page_cache_ttl=60)
+    assert list(tmp_path.glob("*.json.zst")) == []
+
+    pages["page2token"] = {"holders": [{"holderAddress": "0xHolder2", "balance": "1"}], "nextPageToken": None}
+    fake_rpc.calls.clear()
+    summary = create_holders_snapshot("0xToken", client=ankr_client, page_cache_ttl=60)
+
+    assert summary["holder_count"] == 2
+    page_calls = [call["params"].get("pageToken") for call in fake_rpc.calls if call["method"] == "ankr_getTokenHolders"]
+    assert page_calls == ["page2token"]
+
+
+def test_compare_snapshots():
+    """Test new, removed and changed holders are detected."""
+    old = {"holders": [{"address": "0xA", "balance": "1"}, {"address": "0xB", "balance": "2"}]}
+    new = {"holders": [{"address": "0xB", "balance": "3"}, {"address": "0xC", "balance": "4"}]}
+
+    diff = compare_snapshots(old, new)
+
+    assert diff["new_holders"] == [{"address": "0xC", "balance": "4"}]
+    assert diff["removed_holders"] == [{"address": "0xA", "balance": "1"}]
+    assert diff["balance_changes"] == [{"address": "0xB", "old_balance": "2", "new_balance": "3"}]